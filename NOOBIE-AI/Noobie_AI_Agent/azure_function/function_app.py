@@ -6,22 +6,30 @@ Main Azure Functions application with timer-triggered daily blog generation
 and HTTP-triggered manual operations.
 """
 
+import copy
+import dataclasses
 import logging
 import azure.functions as func
-from datetime import datetime, timezone
-import json
-import traceback
+from datetime import date, datetime, timezone
+import orjson
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (first, and only once)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-from claud_agent.config import load_config
+from claud_agent.config import NoobieConfig, load_config
 from claud_agent.logger import setup_logging, get_logger, LogOperation
-from claud_agent.news_fetcher import NewsFetcher
-from claud_agent.blog_writer import BlogWriter
-from claud_agent.github_publisher import GitHubPublisher
+
+if TYPE_CHECKING:
+    from claud_agent.news_fetcher import NewsFetcher
+    from claud_agent.blog_writer import BlogWriter
+    from claud_agent.github_publisher import GitHubPublisher
 
 # Initialize the function app
 app = func.FunctionApp()
@@ -30,6 +38,58 @@ app = func.FunctionApp()
 setup_logging(log_level="INFO", enable_console=True, enable_file=False)
 logger = get_logger("noobie_ai.azure_function")
 
+# Components live for the lifetime of the worker so their HTTP sessions stay warm.
+# They (and their HTTP/feed dependencies) are imported on first use, so routes
+# like the health check don't pay for them on a cold start.
+_CONFIG = load_config()
+_components: Dict[str, Any] = {}
+_components_lock = threading.Lock()
+
+# Set once the Jekyll config and index page are known to be in the repository
+_SITE_SETUP_DONE = False
+
+# UTC date of the last daily post this worker published (or found already published)
+_LAST_SUCCESS_DATE: Optional[date] = None
+
+def _component(name: str, factory: Callable[[], Any]) -> Any:
+    """Create a shared component on first use"""
+    component = _components.get(name)
+    if component is None:
+        with _components_lock:
+            component = _components.get(name)
+            if component is None:
+                component = _components[name] = factory()
+    return component
+
+def _get_news_fetcher() -> 'NewsFetcher':
+    from claud_agent.news_fetcher import NewsFetcher
+    return _component('news_fetcher', lambda: NewsFetcher(_CONFIG))
+
+def _get_blog_writer() -> 'BlogWriter':
+    from claud_agent.blog_writer import BlogWriter
+    return _component('blog_writer', lambda: BlogWriter(_CONFIG))
+
+def _get_github_publisher() -> 'GitHubPublisher':
+    from claud_agent.github_publisher import GitHubPublisher
+    return _component('github_publisher', lambda: GitHubPublisher(_CONFIG))
+
+def _json(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an HTTP response payload"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+def _wants_pretty(req: func.HttpRequest) -> bool:
+    """Indent JSON responses only when the caller asks for it with ?pretty=1"""
+    return req.params.get('pretty') in ('1', 'true')
+
+def _news_fetcher_for(config: NoobieConfig) -> 'NewsFetcher':
+    """Return a NewsFetcher that reads config but shares the module fetcher's session"""
+    if config is _CONFIG:
+        return _get_news_fetcher()
+    
+    news_fetcher = copy.copy(_get_news_fetcher())
+    news_fetcher.config = config
+    return news_fetcher
+
 @app.timer_trigger(schedule="0 0 8 * * *", arg_name="timer", run_on_startup=False,
                   use_monitor=False) 
 def daily_blog_generation(timer: func.TimerRequest) -> None:
@@ -38,12 +98,22 @@ def daily_blog_generation(timer: func.TimerRequest) -> None:
     Fetches news, generates blog post, and publishes to GitHub Pages.
     """
     
+    global _SITE_SETUP_DONE, _LAST_SUCCESS_DATE
+    
+    today = datetime.now(timezone.utc).date()
+    
+    if timer.past_due:
+        logger.warning("⏰ Timer is past due - running a single catch-up pass")
+    
+    if _LAST_SUCCESS_DATE == today:
+        logger.info(f"⏭️ Blog post for {today} already published by this worker - skipping")
+        return
+    
     with LogOperation("Daily blog generation", logger):
         try:
             logger.info("🚀 Starting daily blog generation")
             
-            # Load configuration
-            config = load_config()
+            config = _CONFIG
             logger.info("📋 Configuration loaded", extra_data=config.to_dict())
             
             # Validate configuration
@@ -53,47 +123,62 @@ def daily_blog_generation(timer: func.TimerRequest) -> None:
                 logger.error(error_msg)
                 raise ValueError(error_msg)
             
-            # Initialize components
-            news_fetcher = NewsFetcher(config)
-            blog_writer = BlogWriter(config)
-            github_publisher = GitHubPublisher(config)
-            
-            # Fetch trending news
-            logger.info("📰 Fetching trending news articles")
-            articles = news_fetcher.fetch_trending_news()
-            
-            if not articles:
-                logger.warning("⚠️ No articles found - using mock mode")
-                config.mock_mode = True
-                articles = news_fetcher.generate_mock_articles("global-news", count=3)
+            news_fetcher = _get_news_fetcher()
+            blog_writer = _get_blog_writer()
+            github_publisher = _get_github_publisher()
             
-            logger.info(f"✅ Fetched {len(articles)} articles for processing")
+            # Don't spend news/AI quota again if today's post is already in the repository
+            if config.github_token and github_publisher.has_post_for_date(today):
+                _LAST_SUCCESS_DATE = today
+                logger.info(f"⏭️ Blog post for {today} already exists in {config.github_repo} - skipping")
+                return
             
-            # Generate blog post
-            logger.info("✍️ Generating blog post from articles")
-            blog_post = blog_writer.generate_blog_post(articles)
+            # Setup Jekyll configuration and index page once per worker, overlapped
+            # with news fetching and writing (it must finish before publishing)
+            site_setup = None
+            if not _SITE_SETUP_DONE:
+                logger.info("🏗️ Setting up Jekyll configuration")
+                site_setup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="noobie-site-setup")
+                site_future = site_setup.submit(github_publisher.setup_blog_site)
             
-            if not blog_post:
-                raise Exception("Failed to generate blog post")
-            
-            logger.info(f"✅ Blog post generated: '{blog_post.title}' ({blog_post.word_count} words)")
-            
-            # Setup Jekyll configuration if needed
-            logger.info("🏗️ Setting up Jekyll configuration")
-            jekyll_result = github_publisher.setup_jekyll_config()
-            if not jekyll_result.success:
-                logger.warning(f"Jekyll setup warning: {jekyll_result.message}")
-            
-            # Create index page
-            index_result = github_publisher.create_index_page()
-            if not index_result.success:
-                logger.warning(f"Index page warning: {index_result.message}")
+            try:
+                # Fetch trending news
+                logger.info("📰 Fetching trending news articles")
+                articles = news_fetcher.fetch_trending_news()
+                
+                if not articles:
+                    logger.warning("⚠️ No articles found - using mock mode")
+                    mock_fetcher = _news_fetcher_for(dataclasses.replace(config, mock_mode=True))
+                    articles = mock_fetcher.generate_mock_articles("global-news", count=3)
+                
+                logger.info(f"✅ Fetched {len(articles)} articles for processing")
+                
+                # Generate blog post
+                logger.info("✍️ Generating blog post from articles")
+                blog_post = blog_writer.generate_blog_post(articles)
+                
+                if not blog_post:
+                    raise Exception("Failed to generate blog post")
+                
+                logger.info(f"✅ Blog post generated: '{blog_post.title}' ({blog_post.word_count} words)")
+            finally:
+                # Always reap the setup thread, even if fetching or writing failed
+                if site_setup is not None:
+                    site_setup.shutdown()
+                    site_error = site_future.exception()
+                    if site_error is not None:
+                        logger.error(f"❌ Blog site setup failed: {site_error}")
+                    elif site_future.result().success:
+                        _SITE_SETUP_DONE = True
+                    else:
+                        logger.warning(f"Blog site setup warning: {site_future.result().message}")
             
             # Publish to GitHub Pages
             logger.info("📤 Publishing blog post to GitHub Pages")
             publish_result = github_publisher.publish_blog_post(blog_post)
             
             if publish_result.success:
+                _LAST_SUCCESS_DATE = today
                 logger.info(f"🎉 Blog post published successfully!", extra_data={
                     'title': blog_post.title,
                     'url': publish_result.url,
@@ -118,11 +203,8 @@ def daily_blog_generation(timer: func.TimerRequest) -> None:
             logger.info("📊 Daily blog generation completed successfully", extra_data=execution_stats)
             
         except Exception as e:
-            error_msg = f"Daily blog generation failed: {str(e)}"
-            logger.error(error_msg, extra_data={
-                'error_type': type(e).__name__,
-                'error_message': str(e),
-                'traceback': traceback.format_exc()
+            logger.exception("❌ Daily blog generation failed", extra_data={
+                'error_type': type(e).__name__
             })
             raise
 
@@ -143,19 +225,20 @@ def manual_blog_generation(req: func.HttpRequest) -> func.HttpResponse:
         except ValueError:
             req_body = {}
         
-        # Override configuration if provided
-        config = load_config()
+        # Override configuration if provided (on a copy, never the shared config)
+        overrides = {}
         if 'mock_mode' in req_body:
-            config.mock_mode = bool(req_body['mock_mode'])
+            overrides['mock_mode'] = bool(req_body['mock_mode'])
         if 'max_articles' in req_body:
-            config.max_articles = int(req_body.get('max_articles', config.max_articles))
+            overrides['max_articles'] = int(req_body.get('max_articles', _CONFIG.max_articles))
+        config = dataclasses.replace(_CONFIG, **overrides) if overrides else _CONFIG
         
         logger.info("⚙️ Manual generation parameters", extra_data=req_body)
         
         # Run the same logic as daily generation
-        news_fetcher = NewsFetcher(config)
-        blog_writer = BlogWriter(config)
-        github_publisher = GitHubPublisher(config)
+        news_fetcher = _news_fetcher_for(config)
+        blog_writer = _get_blog_writer()
+        github_publisher = _get_github_publisher()
         
         # Fetch articles
         articles = news_fetcher.fetch_trending_news()
@@ -164,7 +247,7 @@ def manual_blog_generation(req: func.HttpRequest) -> func.HttpResponse:
         
         if not articles:
             return func.HttpResponse(
-                json.dumps({"error": "No articles found"}),
+                _json({"error": "No articles found"}),
                 status_code=400,
                 mimetype="application/json"
             )
@@ -173,7 +256,7 @@ def manual_blog_generation(req: func.HttpRequest) -> func.HttpResponse:
         blog_post = blog_writer.generate_blog_post(articles)
         if not blog_post:
             return func.HttpResponse(
-                json.dumps({"error": "Failed to generate blog post"}),
+                _json({"error": "Failed to generate blog post"}),
                 status_code=500,
                 mimetype="application/json"
             )
@@ -194,14 +277,14 @@ def manual_blog_generation(req: func.HttpRequest) -> func.HttpResponse:
         if publish_result.success:
             logger.info("✅ Manual generation completed successfully", extra_data=response_data)
             return func.HttpResponse(
-                json.dumps(response_data),
+                _json(response_data),
                 status_code=200,
                 mimetype="application/json"
             )
         else:
             logger.error("❌ Manual generation failed", extra_data=response_data)
             return func.HttpResponse(
-                json.dumps(response_data),
+                _json(response_data),
                 status_code=500,
                 mimetype="application/json"
             )
@@ -213,10 +296,10 @@ def manual_blog_generation(req: func.HttpRequest) -> func.HttpResponse:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-        logger.error("❌ Manual generation error", extra_data=error_response)
+        logger.exception("❌ Manual generation error", extra_data={'error_type': type(e).__name__})
         
         return func.HttpResponse(
-            json.dumps(error_response),
+            _json(error_response),
             status_code=500,
             mimetype="application/json"
         )
@@ -229,7 +312,7 @@ def health_check(req: func.HttpRequest) -> func.HttpResponse:
     """
     
     try:
-        config = load_config()
+        config = _CONFIG
         validation_errors = config.validate()
         
         health_data = {
@@ -249,7 +332,7 @@ def health_check(req: func.HttpRequest) -> func.HttpResponse:
         status_code = 200 if not validation_errors else 503
         
         return func.HttpResponse(
-            json.dumps(health_data, indent=2),
+            _json(health_data, pretty=_wants_pretty(req)),
             status_code=status_code,
             mimetype="application/json"
         )
@@ -261,8 +344,10 @@ def health_check(req: func.HttpRequest) -> func.HttpResponse:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
+        logger.exception("❌ Health check error", extra_data={'error_type': type(e).__name__})
+        
         return func.HttpResponse(
-            json.dumps(error_data),
+            _json(error_data),
             status_code=500,
             mimetype="application/json"
         )
@@ -275,12 +360,11 @@ def get_system_status(req: func.HttpRequest) -> func.HttpResponse:
     """
     
     try:
-        config = load_config()
-        github_publisher = GitHubPublisher(config)
+        config = _CONFIG
+        github_publisher = _get_github_publisher()
         
-        # Get repository information
-        repo_info = github_publisher.get_repository_info()
-        recent_posts = github_publisher.list_recent_posts(limit=5)
+        # Get repository information and recent posts in parallel
+        repo_info, recent_posts = github_publisher.get_repository_overview(limit=5)
         
         status_data = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -304,7 +388,7 @@ def get_system_status(req: func.HttpRequest) -> func.HttpResponse:
         }
         
         return func.HttpResponse(
-            json.dumps(status_data, indent=2),
+            _json(status_data, pretty=_wants_pretty(req)),
             status_code=200,
             mimetype="application/json"
         )
@@ -316,8 +400,10 @@ def get_system_status(req: func.HttpRequest) -> func.HttpResponse:
             "error": str(e)
         }
         
+        logger.exception("❌ System status error", extra_data={'error_type': type(e).__name__})
+        
         return func.HttpResponse(
-            json.dumps(error_data),
+            _json(error_data),
             status_code=500,
             mimetype="application/json"
         )
\ No newline at end of file
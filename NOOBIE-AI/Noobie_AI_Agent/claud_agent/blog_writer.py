@@ -7,16 +7,43 @@ with intelligent content structuring and SEO optimization.
 """
 
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
 import re
+import string
 
 from .logger import get_logger, LogOperation
 from .config import NoobieConfig
 from .news_fetcher import NewsArticle
+from .llm_cache import LLMCache, cached_llm
+
+# Precompiled patterns used on every generated post
+_TITLE_RE = re.compile(r'#\s+(.+)')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[\s_-]+')
+_WORD_RE = re.compile(r'\S+')
+
+# Number of generated posts kept for coalescing repeated article sets
+_RECENT_POSTS_LIMIT = 64
+
+# Common topic keywords used for content-based tags (matched as whole words)
+_TOPIC_KEYWORDS = {
+    'politics': frozenset(['political', 'government', 'governments', 'policy', 'policies', 'election', 'elections']),
+    'economics': frozenset(['economic', 'economics', 'market', 'markets', 'financial', 'trade']),
+    'technology': frozenset(['technology', 'technologies', 'ai', 'digital', 'innovation', 'innovations']),
+    'international': frozenset(['international', 'global', 'globally', 'world', 'worldwide', 'diplomatic']),
+    'business': frozenset(['business', 'businesses', 'corporate', 'industry', 'industries', 'company', 'companies'])
+}
+_TOKEN_RE = re.compile(r'[a-z]+')
 
 @dataclass
 class BlogPost:
@@ -33,24 +60,50 @@ class BlogPost:
     seo_description: Optional[str] = None
     featured_image: Optional[str] = None
     
+    # Derived publishing fields, computed once at construction
+    reading_time: int = field(init=False)
+    title_json_escaped: str = field(init=False)
+    seo_excerpt: str = field(init=False)
+    seo_description_effective: str = field(init=False)
+    
+    # Frontmatter skeleton, parsed once for all posts
+    _FRONTMATTER_TEMPLATE = string.Template("""---
+layout: post
+title: "$title"
+date: $publication_date
+author: "$author"
+categories: [$category]
+tags: [$tags]
+excerpt: "$summary"
+seo_title: "$seo_title"
+seo_description: "$seo_description"
+word_count: $word_count
+---
+
+""")
+    
+    def __post_init__(self):
+        self.reading_time = max(1, self.word_count // 200)
+        self.title_json_escaped = orjson.dumps(self.title).decode('utf-8')[1:-1]
+        self.seo_excerpt = orjson.dumps(self.summary[:200]).decode('utf-8')[1:-1]
+        self.seo_description_effective = self.seo_description or self.summary[:155]
+    
     def to_markdown(self) -> str:
         """Convert blog post to markdown with frontmatter"""
         
         # Create frontmatter
-        frontmatter = f"""---
-layout: post
-title: "{self.title}"
-date: {self.publication_date}
-author: "{self.author}"
-categories: [{self.category}]
-tags: [{', '.join(f'"{tag}"' for tag in self.tags)}]
-excerpt: "{self.summary}"
-seo_title: "{self.seo_title or self.title}"
-seo_description: "{self.seo_description or self.summary}"
-word_count: {self.word_count}
----
-
-"""
+        tags_str = '"' + '", "'.join(self.tags) + '"' if self.tags else ''
+        frontmatter = self._FRONTMATTER_TEMPLATE.substitute(
+            title=self.title,
+            publication_date=self.publication_date,
+            author=self.author,
+            category=self.category,
+            tags=tags_str,
+            summary=self.summary,
+            seo_title=self.seo_title or self.title,
+            seo_description=self.seo_description or self.summary,
+            word_count=self.word_count
+        )
         
         return frontmatter + self.content
     
@@ -70,11 +123,100 @@ word_count: {self.word_count}
             'featured_image': self.featured_image
         }
 
+class _StreamCancelled(Exception):
+    """Raised inside a streaming AI call whose hedging race was already won"""
+
+class _StreamCancel:
+    """Lets the hedging race stop a losing streaming call from another thread"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._responses: List[requests.Response] = []
+        self.cancelled = False
+    
+    def track(self, response: requests.Response) -> None:
+        """Register an open streaming response, closing it at once if already cancelled"""
+        with self._lock:
+            if self.cancelled:
+                response.close()
+            else:
+                self._responses.append(response)
+    
+    def cancel(self) -> None:
+        """Close every tracked response so blocked reads stop and no more tokens are streamed"""
+        with self._lock:
+            self.cancelled = True
+            responses, self._responses = self._responses, []
+        for response in responses:
+            response.close()
+
 class BlogWriter:
     """
     Advanced AI blog writer with multiple model support and intelligent content generation
     """
     
+    # Mock post body; only the date and counts change between calls
+    _MOCK_TEMPLATE = """# Today's Global Pulse - {date}
+
+*Generated by NOOBIE AI - Your Daily News Intelligence System*
+
+## Executive Summary
+
+In examining today's global developments, several key themes emerge that deserve thoughtful analysis. Our AI system has analyzed {n_articles} articles across {n_categories} categories to bring you this comprehensive overview.
+
+## Political Developments
+
+Recent political developments continue to shape the international landscape. The interconnected nature of global politics means that decisions in one region often have far-reaching implications across multiple continents.
+
+### Key Political Trends
+
+- International diplomatic initiatives show continued engagement
+- Policy decisions reflect growing focus on economic security
+- Regional cooperation efforts demonstrate multilateral approaches
+
+## Economic Indicators
+
+Global markets continue to demonstrate resilience in the face of various challenges. Current economic indicators suggest a complex but generally positive outlook for sustained growth.
+
+### Market Analysis
+
+The current economic environment rewards adaptability and innovation. Organizations that can balance efficiency with resilience appear best positioned for long-term success.
+
+## Technology and Innovation
+
+The pace of technological advancement continues to accelerate, with artificial intelligence and automation reshaping industries globally. Today's developments highlight both tremendous opportunities and important responsibilities.
+
+### AI Integration Trends
+
+As AI systems like NOOBIE AI become more capable of generating thoughtful analysis, we're reminded that technology's greatest value lies in augmenting human judgment rather than replacing it.
+
+## International Affairs
+
+Regional developments across different continents continue to influence global dynamics. From diplomatic initiatives to economic partnerships, today's international landscape reflects both challenges and opportunities.
+
+### Global Cooperation
+
+The most successful international initiatives appear to be those that recognize both national sovereignty and the benefits of collaborative problem-solving.
+
+## Looking Forward
+
+As we analyze today's developments through our AI lens, several patterns emerge that may offer insights into future trends:
+
+1. **Technological Integration**: Seamless AI incorporation continues to accelerate
+2. **Economic Adaptation**: Markets show remarkable flexibility and innovation
+3. **Global Cooperation**: Evidence of continued international collaboration
+4. **Information Analysis**: AI's growing role in processing and presenting complex information
+
+## Conclusion
+
+Today's analysis reinforces the importance of staying informed about global developments while maintaining perspective on long-term trends. NOOBIE AI will continue providing daily insights to help navigate our complex world.
+
+---
+
+**About NOOBIE AI**: This post was generated by an advanced artificial intelligence system designed to analyze global news and provide thoughtful daily commentary.
+
+*Next update: Tomorrow at 8:00 AM UTC*"""
+    
     def __init__(self, config: NoobieConfig):
         self.config = config
         self.logger = get_logger(__name__)
@@ -82,10 +224,62 @@ class BlogWriter:
         # AI API endpoints
         self.claude_api_url = "https://api.anthropic.com/v1/messages"
         self.openai_api_url = "https://api.openai.com/v1/chat/completions"
+        self.claude_model = "claude-3-sonnet-20240229"
+        self.openai_model = "gpt-4"
+        self.temperature = config.llm_temperature
+        
+        # Response cache so identical prompts skip the LLM round-trip
+        self._llm_cache = LLMCache(config.llm_cache_dir, ttl=config.llm_cache_ttl) if config.enable_llm_cache else None
+        
+        # Persistent HTTP session so retries and fallbacks reuse connections
+        self._session = self._create_session()
+        
+        # Worker threads for hedged AI calls; each call's cancel handle is thread-local
+        self._llm_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="noobie-llm")
+        self._stream_local = threading.local()
+        
+        # Coalescing of identical article sets (in-flight and recently generated)
+        self._coalesce_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._recent_posts: 'OrderedDict[str, BlogPost]' = OrderedDict()
         
         # Content templates
         self.system_prompt = self._load_system_prompt()
         
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session for the AI APIs"""
+        
+        retry = Retry(
+            total=self.config.retry_attempts,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("https://api.anthropic.com", adapter)
+        session.mount("https://api.openai.com", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        
+        return session
+    
+    def close(self) -> None:
+        """Stop the AI call workers and close the underlying HTTP session"""
+        executor = getattr(self, '_llm_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._llm_executor = None
+        
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+            self._session = None
+    
+    def __del__(self):
+        self.close()
+    
     def _load_system_prompt(self) -> str:
         """Load the system prompt for AI content generation"""
         
@@ -114,20 +308,20 @@ Always maintain objectivity while providing thoughtful analysis of current event
 
         return default_prompt
     
-    def _create_content_prompt(self, articles: List[NewsArticle]) -> str:
+    def _create_content_prompt(self, articles: List[NewsArticle], now: datetime) -> str:
         """Create the content generation prompt from articles"""
         
-        articles_text = "\n\n".join([
-            f"**Article {i+1}:**\n"
-            f"Title: {article.title}\n"
-            f"Source: {article.source}\n"
-            f"Summary: {article.summary}\n"
-            f"Category: {article.category}\n"
-            f"URL: {article.url}"
-            for i, article in enumerate(articles)
-        ])
+        parts = []
+        for i, article in enumerate(articles, 1):
+            if i > 1:
+                parts.append("\n\n")
+            parts.append(
+                f"**Article {i}:**\nTitle: {article.title}\nSource: {article.source}\n"
+                f"Summary: {article.summary}\nCategory: {article.category}\nURL: {article.url}"
+            )
+        articles_text = "".join(parts)
         
-        current_date = datetime.now().strftime("%B %d, %Y")
+        current_date = now.strftime("%B %d, %Y")
         
         prompt = f"""Based on the following news articles from {current_date}, create a comprehensive blog post that analyzes the key themes and developments:
 
@@ -147,6 +341,108 @@ Format the response as a complete blog post in markdown format."""
 
         return prompt
     
+    def _iter_sse_events(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """Yield decoded JSON payloads from a server-sent events response"""
+        
+        cancel = getattr(self._stream_local, 'cancel', None)
+        if cancel is not None:
+            cancel.track(response)
+        
+        try:
+            for line in response.iter_lines():
+                if cancel is not None and cancel.cancelled:
+                    raise _StreamCancelled()
+                
+                if not line.startswith(b'data:'):
+                    continue
+                
+                data = line[5:].strip()
+                if data == b'[DONE]':
+                    break
+                
+                yield orjson.loads(data)
+        except Exception:
+            # Reads on a response closed by cancel() fail with transport errors
+            if cancel is not None and cancel.cancelled:
+                raise _StreamCancelled() from None
+            raise
+    
+    def _call_claude_api_stream(self, prompt: str) -> Iterator[str]:
+        """Stream text deltas from the Claude API"""
+        
+        headers = {
+            "x-api-key": self.config.claude_api_key,
+            "anthropic-version": "2023-06-01"
+        }
+        
+        payload = {
+            "model": self.claude_model,
+            "max_tokens": 4000,
+            "temperature": self.temperature,
+            "stream": True,
+            "system": self.system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+        
+        with self._session.post(
+            self.claude_api_url,
+            headers=headers,
+            data=orjson.dumps(payload),
+            timeout=120,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            for event in self._iter_sse_events(response):
+                event_type = event.get('type')
+                
+                if event_type == 'content_block_delta':
+                    text = event.get('delta', {}).get('text')
+                    if text:
+                        yield text
+                elif event_type == 'error':
+                    raise ValueError(event.get('error', {}).get('message', 'Claude API stream error'))
+    
+    def _call_openai_api_stream(self, prompt: str) -> Iterator[str]:
+        """Stream text deltas from the OpenAI API"""
+        
+        headers = {
+            "Authorization": f"Bearer {self.config.openai_api_key}"
+        }
+        
+        payload = {
+            "model": self.openai_model,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 4000,
+            "temperature": self.temperature,
+            "stream": True
+        }
+        
+        with self._session.post(
+            self.openai_api_url,
+            headers=headers,
+            data=orjson.dumps(payload),
+            timeout=120,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            for event in self._iter_sse_events(response):
+                choices = event.get('choices')
+                if choices:
+                    text = choices[0].get('delta', {}).get('content')
+                    if text:
+                        yield text
+    
+    @cached_llm('claude_model', 'temperature')
     def _call_claude_api(self, prompt: str) -> Optional[str]:
         """Call Claude API for content generation"""
         
@@ -155,44 +451,19 @@ Format the response as a complete blog post in markdown format."""
             return None
         
         with LogOperation("Claude API call", self.logger):
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": self.config.claude_api_key,
-                "anthropic-version": "2023-06-01"
-            }
-            
-            payload = {
-                "model": "claude-3-sonnet-20240229",
-                "max_tokens": 4000,
-                "temperature": 0.7,
-                "system": self.system_prompt,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
-            
             try:
-                response = requests.post(
-                    self.claude_api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=120
-                )
-                
-                response.raise_for_status()
-                data = response.json()
+                content = "".join(self._call_claude_api_stream(prompt))
                 
-                if 'content' in data and data['content']:
-                    content = data['content'][0].get('text', '')
+                if content:
                     self.logger.info(f"✅ Claude API response received ({len(content)} characters)")
                     return content
                 else:
                     self.logger.error("❌ Invalid response format from Claude API")
                     return None
                     
+            except _StreamCancelled:
+                self.logger.info("🛑 Claude API call cancelled - the other API answered first")
+                return None
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"❌ Claude API request failed: {e}")
                 return None
@@ -200,6 +471,7 @@ Format the response as a complete blog post in markdown format."""
                 self.logger.error(f"❌ Error processing Claude API response: {e}")
                 return None
     
+    @cached_llm('openai_model', 'temperature')
     def _call_openai_api(self, prompt: str) -> Optional[str]:
         """Call OpenAI API as fallback"""
         
@@ -208,40 +480,19 @@ Format the response as a complete blog post in markdown format."""
             return None
         
         with LogOperation("OpenAI API call", self.logger):
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.config.openai_api_key}"
-            }
-            
-            payload = {
-                "model": "gpt-4",
-                "messages": [
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 4000,
-                "temperature": 0.7
-            }
-            
             try:
-                response = requests.post(
-                    self.openai_api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=120
-                )
-                
-                response.raise_for_status()
-                data = response.json()
+                content = "".join(self._call_openai_api_stream(prompt))
                 
-                if 'choices' in data and data['choices']:
-                    content = data['choices'][0]['message']['content']
+                if content:
                     self.logger.info(f"✅ OpenAI API response received ({len(content)} characters)")
                     return content
                 else:
                     self.logger.error("❌ Invalid response format from OpenAI API")
                     return None
                     
+            except _StreamCancelled:
+                self.logger.info("🛑 OpenAI API call cancelled - the other API answered first")
+                return None
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"❌ OpenAI API request failed: {e}")
                 return None
@@ -249,111 +500,164 @@ Format the response as a complete blog post in markdown format."""
                 self.logger.error(f"❌ Error processing OpenAI API response: {e}")
                 return None
     
-    def _generate_mock_content(self, articles: List[NewsArticle]) -> str:
+    def _generate_ai_content(self, prompt: str) -> Optional[str]:
+        """Generate content with Claude, hedging with OpenAI when Claude is slow or fails"""
+        
+        if not (self.config.claude_api_key and self.config.openai_api_key):
+            # Nothing to hedge with - use whichever API is configured
+            if self.config.claude_api_key:
+                return self._call_claude_api(prompt)
+            if self.config.openai_api_key:
+                return self._call_openai_api(prompt)
+            return None
+        
+        claude_cancel = _StreamCancel()
+        openai_cancel = _StreamCancel()
+        pending = {self._llm_executor.submit(self._call_cancellable, claude_cancel, self._call_claude_api, prompt)}
+        openai_future = None
+        try:
+            done, pending = wait(pending, timeout=self.config.llm_hedge_delay)
+            
+            for future in done:
+                if future.result():
+                    return future.result()
+            
+            if done:
+                self.logger.info("🔄 Falling back to OpenAI API")
+            else:
+                self.logger.info(f"⏱️ Claude API slower than {self.config.llm_hedge_delay}s, racing OpenAI API")
+            openai_future = self._llm_executor.submit(self._call_cancellable, openai_cancel, self._call_openai_api, prompt)
+            pending.add(openai_future)
+            
+            # Take the first successful response; the slower call is cancelled below
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.result():
+                        return future.result()
+            
+            return None
+        finally:
+            # Stop the loser streaming (and billing) instead of letting it run to its timeout
+            for future in pending:
+                future.cancel()
+                (openai_cancel if future is openai_future else claude_cancel).cancel()
+    
+    def _call_cancellable(self, cancel: _StreamCancel, call, prompt: str) -> Optional[str]:
+        """Run an AI API call on a worker thread with cancel as its stream cancel handle"""
+        
+        self._stream_local.cancel = cancel
+        try:
+            return call(prompt)
+        finally:
+            self._stream_local.cancel = None
+    
+    def _generate_mock_content(self, articles: List[NewsArticle], now: datetime) -> str:
         """Generate mock content for testing"""
         
-        current_date = datetime.now().strftime("%B %d, %Y")
-        categories = list(set(article.category for article in articles))
+        mock_content = self._MOCK_TEMPLATE.format(
+            date=now.strftime("%B %d, %Y"),
+            n_articles=len(articles),
+            n_categories=len({article.category for article in articles})
+        )
         
-        mock_content = f"""# Today's Global Pulse - {current_date}
-
-*Generated by NOOBIE AI - Your Daily News Intelligence System*
-
-## Executive Summary
-
-In examining today's global developments, several key themes emerge that deserve thoughtful analysis. Our AI system has analyzed {len(articles)} articles across {len(categories)} categories to bring you this comprehensive overview.
-
-## Political Developments
-
-Recent political developments continue to shape the international landscape. The interconnected nature of global politics means that decisions in one region often have far-reaching implications across multiple continents.
-
-### Key Political Trends
-
-- International diplomatic initiatives show continued engagement
-- Policy decisions reflect growing focus on economic security
-- Regional cooperation efforts demonstrate multilateral approaches
-
-## Economic Indicators
-
-Global markets continue to demonstrate resilience in the face of various challenges. Current economic indicators suggest a complex but generally positive outlook for sustained growth.
-
-### Market Analysis
-
-The current economic environment rewards adaptability and innovation. Organizations that can balance efficiency with resilience appear best positioned for long-term success.
-
-## Technology and Innovation
-
-The pace of technological advancement continues to accelerate, with artificial intelligence and automation reshaping industries globally. Today's developments highlight both tremendous opportunities and important responsibilities.
-
-### AI Integration Trends
-
-As AI systems like NOOBIE AI become more capable of generating thoughtful analysis, we're reminded that technology's greatest value lies in augmenting human judgment rather than replacing it.
-
-## International Affairs
-
-Regional developments across different continents continue to influence global dynamics. From diplomatic initiatives to economic partnerships, today's international landscape reflects both challenges and opportunities.
-
-### Global Cooperation
-
-The most successful international initiatives appear to be those that recognize both national sovereignty and the benefits of collaborative problem-solving.
-
-## Looking Forward
-
-As we analyze today's developments through our AI lens, several patterns emerge that may offer insights into future trends:
-
-1. **Technological Integration**: Seamless AI incorporation continues to accelerate
-2. **Economic Adaptation**: Markets show remarkable flexibility and innovation
-3. **Global Cooperation**: Evidence of continued international collaboration
-4. **Information Analysis**: AI's growing role in processing and presenting complex information
-
-## Conclusion
-
-Today's analysis reinforces the importance of staying informed about global developments while maintaining perspective on long-term trends. NOOBIE AI will continue providing daily insights to help navigate our complex world.
-
----
-
-**About NOOBIE AI**: This post was generated by an advanced artificial intelligence system designed to analyze global news and provide thoughtful daily commentary.
-
-*Next update: Tomorrow at 8:00 AM UTC*"""
-
         self.logger.info("🎭 Generated mock blog content for testing")
         return mock_content
     
+    def _coalesce_key(self, articles: List[NewsArticle], now: datetime) -> str:
+        """Key identifying a day's generation for a given set of articles and writer settings"""
+        digest = hashlib.sha256(now.strftime("%Y-%m-%d").encode('utf-8'))
+        
+        # Settings that shape the post (mock articles reuse URLs, so they aren't enough alone)
+        for setting in (self.config.blog_title, self.config.author_name, str(self.config.mock_mode),
+                        self.claude_model, self.openai_model, str(self.temperature)):
+            digest.update(b'\n')
+            digest.update(setting.encode('utf-8'))
+        
+        for category, title, url in sorted((article.category, article.title, article.url) for article in articles):
+            digest.update(b'\n')
+            digest.update(f"{category}\t{title}\t{url}".encode('utf-8'))
+        return digest.hexdigest()
+    
     def generate_blog_post(self, articles: List[NewsArticle]) -> Optional[BlogPost]:
-        """Generate a complete blog post from news articles"""
+        """
+        Generate a complete blog post from news articles.
+        
+        Identical article sets on the same day are coalesced: concurrent callers
+        wait for the in-flight generation and later callers get the recent result.
+        """
         
         if not articles:
             self.logger.error("❌ No articles provided for blog generation")
             return None
         
+        # Single clock read shared by the prompt, mock content and post metadata
+        now = datetime.now()
+        key = self._coalesce_key(articles, now)
+        
+        with self._coalesce_lock:
+            recent = self._recent_posts.get(key)
+            if recent is not None:
+                self._recent_posts.move_to_end(key)
+                self.logger.info(f"♻️ Reusing blog post generated for the same articles: {recent.title}")
+                return recent
+            
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        
+        if not is_owner:
+            self.logger.info("⏳ Waiting for in-flight generation of the same articles")
+            return future.result()
+        
+        try:
+            blog_post, reusable = self._generate_blog_post(articles, now)
+        except BaseException as e:
+            with self._coalesce_lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        
+        with self._coalesce_lock:
+            self._inflight.pop(key, None)
+            if reusable:
+                self._recent_posts[key] = blog_post
+                if len(self._recent_posts) > _RECENT_POSTS_LIMIT:
+                    self._recent_posts.popitem(last=False)
+        
+        future.set_result(blog_post)
+        return blog_post
+    
+    def _generate_blog_post(self, articles: List[NewsArticle], now: datetime) -> Tuple[Optional[BlogPost], bool]:
+        """
+        Generate a blog post without coalescing.
+        
+        Returns the post and whether it may be reused for the same articles
+        (mock fallback content is not, so a later call can retry the AI APIs).
+        """
+        
         with LogOperation(f"Blog generation from {len(articles)} articles", self.logger):
             
             # Create content prompt
-            content_prompt = self._create_content_prompt(articles)
+            content_prompt = self._create_content_prompt(articles, now)
             
-            # Try to generate content with AI APIs
-            blog_content = None
+            # Try to generate content with AI APIs (Claude first, OpenAI as backup)
+            blog_content = self._generate_ai_content(content_prompt)
             
-            # Try Claude first
-            if self.config.claude_api_key:
-                blog_content = self._call_claude_api(content_prompt)
-            
-            # Fallback to OpenAI
-            if not blog_content and self.config.openai_api_key:
-                self.logger.info("🔄 Falling back to OpenAI API")
-                blog_content = self._call_openai_api(content_prompt)
+            reusable = bool(blog_content)
             
             # Fallback to mock content
             if not blog_content:
                 self.logger.warning("🎭 Using mock content generation")
-                blog_content = self._generate_mock_content(articles)
+                blog_content = self._generate_mock_content(articles, now)
             
             if not blog_content:
                 self.logger.error("❌ Failed to generate blog content")
-                return None
+                return None, False
             
             # Parse and structure the blog post
-            blog_post = self._parse_blog_content(blog_content, articles)
+            blog_post = self._parse_blog_content(blog_content, articles, now)
             
             self.logger.info(f"✅ Blog post generated successfully", extra_data={
                 'title': blog_post.title,
@@ -362,28 +666,35 @@ Today's analysis reinforces the importance of staying informed about global deve
                 'category': blog_post.category
             })
             
-            return blog_post
+            return blog_post, reusable
     
-    def _parse_blog_content(self, content: str, source_articles: List[NewsArticle]) -> BlogPost:
+    def _parse_blog_content(self, content: str, source_articles: List[NewsArticle], now: datetime) -> BlogPost:
         """Parse AI-generated content into structured blog post"""
         
         # Extract title (usually the first # heading)
-        title_match = re.search(r'#\s+(.+)', content)
-        title = title_match.group(1).strip() if title_match else f"Daily Global Analysis - {datetime.now().strftime('%B %d, %Y')}"
+        title_match = _TITLE_RE.search(content)
+        title = title_match.group(1).strip() if title_match else f"Daily Global Analysis - {now.strftime('%B %d, %Y')}"
         
         # Generate summary from first paragraph
         paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and not p.startswith('#')]
         summary = paragraphs[0][:200] + "..." if paragraphs else "Daily AI-powered analysis of global news and trends."
         
-        # Extract categories from source articles
-        categories = list(set(article.category for article in source_articles))
-        primary_category = categories[0] if categories else "global-news"
+        # Extract categories and category tag words in one pass over the articles
+        categories = set()
+        category_tag_words = []
+        category_tokens = self.config.news_category_tokens
+        for article in source_articles:
+            categories.add(article.category)
+            tokens = category_tokens.get(article.category)
+            category_tag_words.extend(tokens if tokens is not None else article.category.lower().split())
+        
+        primary_category = next(iter(categories)) if categories else "global-news"
         
         # Generate tags
-        tags = self._generate_tags(content, source_articles)
+        tags = self._generate_tags(content, category_tag_words)
         
         # Calculate word count
-        word_count = len(content.split())
+        word_count = sum(1 for _ in _WORD_RE.finditer(content))
         
         # Generate SEO elements
         seo_title = f"{title} | {self.config.blog_title}"
@@ -395,7 +706,7 @@ Today's analysis reinforces the importance of staying informed about global deve
             summary=summary,
             tags=tags,
             category=primary_category,
-            publication_date=datetime.now().isoformat(),
+            publication_date=now.isoformat(),
             author=self.config.author_name,
             word_count=word_count,
             seo_title=seo_title,
@@ -404,64 +715,56 @@ Today's analysis reinforces the importance of staying informed about global deve
         
         return blog_post
     
-    def _generate_tags(self, content: str, articles: List[NewsArticle]) -> List[str]:
-        """Generate relevant tags from content and source articles"""
+    def _generate_tags(self, content: str, category_tag_words: List[str]) -> List[str]:
+        """Generate relevant tags from content and source article category words"""
         
         # Base tags
-        tags = ["daily-update", "ai-generated", "global-news", "analysis"]
+        tags = {"daily-update", "ai-generated", "global-news", "analysis"}
         
         # Add category-based tags
-        for article in articles:
-            category_words = article.category.lower().split()
-            tags.extend(category_words)
-        
-        # Add content-based tags
-        content_lower = content.lower()
-        
-        # Common topic keywords
-        topic_keywords = {
-            'politics': ['political', 'government', 'policy', 'election'],
-            'economics': ['economic', 'market', 'financial', 'trade'],
-            'technology': ['technology', 'ai', 'digital', 'innovation'],
-            'international': ['international', 'global', 'world', 'diplomatic'],
-            'business': ['business', 'corporate', 'industry', 'company']
-        }
+        tags.update(category_tag_words)
         
-        for tag, keywords in topic_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                tags.append(tag)
+        # Add content-based tags from a single tokenization of the content
+        tokens = set(_TOKEN_RE.findall(content.lower()))
         
-        # Remove duplicates and limit
-        unique_tags = list(set(tags))[:10]
+        for tag, keywords in _TOPIC_KEYWORDS.items():
+            if not tokens.isdisjoint(keywords):
+                tags.add(tag)
         
-        return unique_tags
+        # Limit number of tags
+        return list(tags)[:10]
     
-    def save_blog_post(self, blog_post: BlogPost, output_dir: str = "blog_output") -> str:
-        """Save blog post to file"""
-        
-        from pathlib import Path
+    def save_blog_post(self, blog_post: BlogPost, output_dir: str = "blog_output", now: Optional[datetime] = None) -> str:
+        """Save blog post to file (dated by now, defaulting to the current time)"""
         
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
         # Generate filename
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        title_slug = re.sub(r'[^\w\s-]', '', blog_post.title.lower())
-        title_slug = re.sub(r'[\s_-]+', '-', title_slug)[:50]
+        date_str = (now or datetime.now()).strftime("%Y-%m-%d")
+        title_slug = _SLUG_STRIP_RE.sub('', blog_post.title.lower())
+        title_slug = _SLUG_DASH_RE.sub('-', title_slug)[:50]
         filename = f"{date_str}-{title_slug}.md"
         
         file_path = output_path / filename
+        json_path = output_path / f"{date_str}-{title_slug}.json"
         
-        # Save as markdown
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(blog_post.to_markdown())
+        def write_markdown() -> None:
+            file_path.write_text(blog_post.to_markdown(), encoding='utf-8')
         
-        self.logger.info(f"💾 Blog post saved to: {file_path}")
+        def write_json_backup() -> None:
+            json_path.write_bytes(orjson.dumps(blog_post.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
-        # Also save as JSON for backup
-        json_path = output_path / f"{date_str}-{title_slug}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(blog_post.to_dict(), f, indent=2, ensure_ascii=False)
+        if self.config.save_local_backup:
+            # Save as markdown and JSON backup concurrently (both are I/O bound)
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="noobie-save") as executor:
+                futures = [executor.submit(write_markdown), executor.submit(write_json_backup)]
+                for future in futures:
+                    future.result()
+        else:
+            write_markdown()
+        
+        self.logger.info(f"💾 Blog post saved to: {file_path}")
         
-        return str(file_path)
\ No newline at end of file
+        return str(file_path)
@@ -7,11 +7,27 @@ for the NOOBIE AI system.
 """
 
 import os
-import json
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+import orjson
+from dataclasses import dataclass, field, MISSING
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from pathlib import Path
 
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer environment variable"""
+    value = env.get(key)
+    return int(value) if value is not None else default
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a float environment variable"""
+    value = env.get(key)
+    return float(value) if value is not None else default
+
+def _env_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    """Read a 'true'/'false' environment variable"""
+    value = env.get(key)
+    return value.lower() == 'true' if value is not None else default
+
 @dataclass
 class NoobieConfig:
     """
@@ -36,6 +52,8 @@ class NoobieConfig:
     max_articles: int = 8
     min_article_length: int = 100
     max_blog_length: int = 3000
+    llm_hedge_delay: int = 30  # seconds before racing the backup AI API
+    llm_temperature: float = 0.7  # 0 makes AI responses deterministic and cacheable
     
     # Logging
     log_level: str = "INFO"
@@ -52,6 +70,16 @@ class NoobieConfig:
     save_local_backup: bool = True
     enable_analytics: bool = True
     mock_mode: bool = False
+    enable_llm_cache: bool = True
+    
+    # LLM Response Cache
+    llm_cache_dir: Optional[str] = None  # defaults to <tempdir>/noobie_llm_cache
+    llm_cache_ttl: int = 6 * 3600  # 6 hours
+    
+    # News Article Cache
+    enable_news_cache: bool = True
+    news_cache_dir: Optional[str] = None  # defaults to <tempdir>/noobie_news
+    cache_ttl_seconds: int = 3600  # 1 hour
     
     # News Categories
     news_categories: List[str] = field(default_factory=lambda: [
@@ -62,44 +90,56 @@ class NoobieConfig:
         "breaking news"
     ])
     
+    @cached_property
+    def news_category_tokens(self) -> Dict[str, List[str]]:
+        """Lowercased word tokens for each configured news category"""
+        return {category: category.lower().split() for category in self.news_categories}
+    
     @classmethod
     def from_env(cls) -> 'NoobieConfig':
         """Create configuration from environment variables"""
+        env = os.environ
         return cls(
             # API Keys
-            news_api_key=os.getenv('NEWS_API_KEY'),
-            claude_api_key=os.getenv('CLAUDE_API_KEY'),
-            openai_api_key=os.getenv('OPENAI_API_KEY'),
+            news_api_key=env.get('NEWS_API_KEY'),
+            claude_api_key=env.get('CLAUDE_API_KEY'),
+            openai_api_key=env.get('OPENAI_API_KEY'),
             
             # GitHub
-            github_token=os.getenv('GITHUB_TOKEN'),
-            github_repo=os.getenv('GITHUB_REPO', 'akhilreddydanda/NOOBIE'),
-            github_branch=os.getenv('GITHUB_BRANCH', 'main'),
+            github_token=env.get('GITHUB_TOKEN'),
+            github_repo=env.get('GITHUB_REPO', 'akhilreddydanda/NOOBIE'),
+            github_branch=env.get('GITHUB_BRANCH', 'main'),
             
             # Blog Settings
-            blog_title=os.getenv('BLOG_TITLE', 'NOOBIE AI - Daily News Intelligence'),
-            author_name=os.getenv('AUTHOR_NAME', 'NOOBIE AI'),
+            blog_title=env.get('BLOG_TITLE', 'NOOBIE AI - Daily News Intelligence'),
+            author_name=env.get('AUTHOR_NAME', 'NOOBIE AI'),
             
             # Processing
-            max_articles=int(os.getenv('MAX_ARTICLES', '8')),
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            max_articles=_env_int(env, 'MAX_ARTICLES', 8),
+            llm_temperature=_env_float(env, 'LLM_TEMPERATURE', 0.7),
+            log_level=env.get('LOG_LEVEL', 'INFO'),
             
             # Features
-            upload_to_github=os.getenv('UPLOAD_TO_GITHUB', 'true').lower() == 'true',
-            mock_mode=os.getenv('MOCK_MODE', 'false').lower() == 'true',
-            retry_attempts=int(os.getenv('RETRY_ATTEMPTS', '3')),
+            upload_to_github=_env_bool(env, 'UPLOAD_TO_GITHUB', True),
+            mock_mode=_env_bool(env, 'MOCK_MODE', False),
+            retry_attempts=_env_int(env, 'RETRY_ATTEMPTS', 3),
         )
     
     @classmethod
     def from_file(cls, config_path: str) -> 'NoobieConfig':
         """Load configuration from JSON file"""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        with open(config_path, 'rb') as f:
+            config_data = orjson.loads(f.read())
         
         return cls(**config_data)
     
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors"""
+        return list(self.validation_errors)
+    
+    @cached_property
+    def validation_errors(self) -> List[str]:
+        """Validation errors, computed once (the configuration is not changed after loading)"""
         errors = []
         
         # Check required API keys
@@ -119,6 +159,9 @@ class NoobieConfig:
         if self.retry_attempts < 1 or self.retry_attempts > 10:
             errors.append("retry_attempts must be between 1 and 10")
         
+        if self.llm_temperature < 0 or self.llm_temperature > 1:
+            errors.append("llm_temperature must be between 0 and 1")
+        
         return errors
     
     def to_dict(self) -> Dict[str, Any]:
@@ -143,15 +186,42 @@ class NoobieConfig:
         """Save configuration to JSON file (excluding sensitive data)"""
         config_dict = self.to_dict()
         
-        with open(config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        with open(config_path, 'wb') as f:
+            f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
 
+def _build_merge_function() -> Callable[[NoobieConfig, NoobieConfig], None]:
+    """
+    Generate a straight-line merge function for the NoobieConfig fields.
+    
+    Each field keeps the env value if it differs from the field default,
+    otherwise it takes the file value. Fields built by a default_factory
+    have no default to compare against and always keep the env value.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _merge_configs(config, file_config):"]
+    
+    for name, field_def in NoobieConfig.__dataclass_fields__.items():
+        if field_def.default is MISSING:
+            continue
+        namespace[f"_default_{name}"] = field_def.default
+        lines.append(f"    if config.{name} == _default_{name}: config.{name} = file_config.{name}")
+    
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace['_merge_configs']
+
+_merge_configs = _build_merge_function()
+
+@lru_cache(maxsize=1)
 def load_config() -> NoobieConfig:
     """
     Load configuration with priority:
     1. Environment variables
     2. config.json file
     3. Default values
+    
+    The result is cached for the life of the process; use
+    load_config.cache_clear() to pick up changed settings.
     """
     # Try to load from environment first
     config = NoobieConfig.from_env()
@@ -162,13 +232,7 @@ def load_config() -> NoobieConfig:
         try:
             file_config = NoobieConfig.from_file(str(config_file))
             # Merge configurations (env takes priority)
-            for field_name, field_def in config.__dataclass_fields__.items():
-                env_value = getattr(config, field_name)
-                file_value = getattr(file_config, field_name)
-                
-                # Use env value if set, otherwise use file value
-                if env_value == field_def.default:
-                    setattr(config, field_name, file_value)
+            _merge_configs(config, file_config)
                     
         except Exception as e:
             print(f"Warning: Could not load config.json: {e}")
@@ -196,7 +260,7 @@ def create_sample_config() -> None:
         ]
     }
     
-    with open('config.json', 'w') as f:
-        json.dump(sample_config, f, indent=2)
+    with open('config.json', 'wb') as f:
+        f.write(orjson.dumps(sample_config, option=orjson.OPT_INDENT_2))
     
     print("Sample config.json created. Please edit with your settings.")
\ No newline at end of file
@@ -6,18 +6,172 @@ Advanced GitHub Pages publishing with automatic commit, push,
 and Jekyll optimization for professional blog deployment.
 """
 
-import requests
 import base64
-import json
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import heapq
+import operator
+import re
+import shelve
+import string
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import cached_property, lru_cache, partial
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from .logger import get_logger, LogOperation
+from .logger import get_logger, LogOperation, log_performance_metric
 from .config import NoobieConfig
 from .blog_writer import BlogPost
 
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_COLLAPSE = re.compile(r'[\s_-]+')
+
+def _slugify(title: str) -> str:
+    """Turn a post title into a URL/filename slug"""
+    return _SLUG_COLLAPSE.sub('-', _SLUG_STRIP.sub('', title.lower()))[:50].strip('-')
+
+def _git_blob_sha(content: str) -> str:
+    """SHA-1 git would assign to content as a blob"""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+@lru_cache(maxsize=256)
+def _parsed_pub_date(publication_date: str) -> datetime:
+    """Parse a BlogPost.publication_date ISO string (memoized)"""
+    return datetime.fromisoformat(publication_date.replace('Z', '+00:00'))
+
+_JEKYLL_CONFIG_TEMPLATE = string.Template("""# NOOBIE AI Blog Configuration
+title: "$blog_title"
+description: "$blog_description"
+url: "https://$owner_lower.github.io"
+baseurl: ""
+
+# Author information
+author:
+  name: "$author_name"
+  bio: "AI-powered daily news analysis and global insights"
+  avatar: "/assets/images/noobie-avatar.png"
+
+# Social links
+github_username: $owner
+
+# Build settings
+markdown: kramdown
+highlighter: rouge
+permalink: /:year/:month/:day/:title/
+
+# Theme
+theme: minima
+
+# Plugins
+plugins:
+  - jekyll-feed
+  - jekyll-sitemap
+  - jekyll-seo-tag
+  - jekyll-paginate
+
+# Pagination
+paginate: 10
+paginate_path: "/page:num/"
+
+# SEO
+seo:
+  title: "$blog_title"
+  description: "$blog_description"
+  keywords: "AI, blog, news, analysis, artificial intelligence, global news, automated blogging"
+
+# Timezone
+timezone: UTC
+
+# Collections
+collections:
+  posts:
+    output: true
+    permalink: /:year/:month/:day/:title/
+
+# Defaults
+defaults:
+  - scope:
+      path: ""
+      type: "posts"
+    values:
+      layout: "post"
+      author: "$author_name"
+      show_excerpts: true
+
+# Exclude
+exclude:
+  - Gemfile
+  - Gemfile.lock
+  - node_modules
+  - vendor/bundle/
+  - vendor/cache/
+  - vendor/gems/
+  - vendor/ruby/
+""")
+
+_INDEX_PAGE_TEMPLATE = string.Template("""---
+layout: home
+title: "$blog_title"
+description: "$blog_description"
+---
+
+# Welcome to $blog_title
+
+$blog_description
+
+## Latest Posts
+
+<div class="post-list">
+{% for post in site.posts limit:5 %}
+  <article class="post-preview">
+    <h3><a href="{{ post.url }}">{{ post.title }}</a></h3>
+    <p class="post-meta">{{ post.date | date: "%B %d, %Y" }} • {{ post.reading_time }} min read</p>
+    <p>{{ post.excerpt | strip_html | truncate: 200 }}</p>
+    <a href="{{ post.url }}" class="read-more">Read more →</a>
+  </article>
+{% endfor %}
+</div>
+
+## About NOOBIE AI
+
+NOOBIE AI is an advanced artificial intelligence system that analyzes global news and generates thoughtful daily blog posts. Our AI examines multiple news sources, identifies key themes, and creates insightful commentary that goes beyond simple news reporting.
+
+### What Makes NOOBIE AI Special?
+
+- **🤖 AI-Powered Analysis**: Advanced language models process and analyze news from multiple sources
+- **📰 Daily Updates**: Fresh content generated automatically every morning at 8:00 AM UTC
+- **🌍 Global Perspective**: Comprehensive coverage of international developments
+- **💡 Thoughtful Commentary**: Analysis that provides context and insights
+
+### Latest Statistics
+
+- **Total Posts**: {{ site.posts.size }}
+- **Categories Covered**: Politics, Technology, Economics, International Affairs
+- **Average Reading Time**: 5-8 minutes per post
+- **Update Frequency**: Daily at 8:00 AM UTC
+
+---
+
+*Powered by artificial intelligence • Built with Jekyll • Hosted on GitHub Pages*
+""")
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After but never sleeps longer than max_retry_after seconds"""
+    
+    max_retry_after = 60.0
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.max_retry_after)
+
 @dataclass
 class PublishResult:
     """Result of publishing operation"""
@@ -42,8 +196,43 @@ class GitHubPublisher:
         
         # GitHub API settings
         self.api_base_url = "https://api.github.com"
+        self.request_timeout = 30
+        self.max_concurrent_requests = 8
+        
+        # Repository tree cache (path -> blob SHA) for existence checks and listings
+        self.tree_cache_ttl = 60
+        self._tree_lock = threading.Lock()
+        self._head_sha: Optional[str] = None
+        self._head_tree_sha: Optional[str] = None
+        self._path_to_sha: Optional[Dict[str, str]] = None
+        self._path_to_size: Dict[str, int] = {}
+        self._tree_checked_at = 0.0
+        
+        # Conditional-GET cache (endpoint -> (ETag, body)); 304s don't count against the rate limit.
+        # Loaded from disk on first use and written back by flush_etag_cache()
+        self.etag_cache_path = str(Path(tempfile.gettempdir()) / "noobie_github_etags")
+        self._etag_cache: Optional[Dict[str, Tuple[str, Any]]] = None
+        self._etag_dirty: set = set()
+        self._etag_lock = threading.Lock()
+        
+        # Report the remaining API quota once it drops below this many requests
+        self.rate_limit_warning_threshold = 100
+        
         self.session = requests.Session()
         
+        # Keep one warm connection pool for all GitHub calls. Only idempotent requests are
+        # retried automatically; Git Data POSTs and the ref PATCH fail fast (see commit_files)
+        retry = _CappedRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        
         if config.github_token:
             self.session.headers.update({
                 "Authorization": f"token {config.github_token}",
@@ -51,25 +240,108 @@ class GitHubPublisher:
                 "User-Agent": "NOOBIE-AI/1.0"
             })
     
+    @cached_property
+    def _repo_owner(self) -> str:
+        """Owner part of config.github_repo"""
+        return self.config.github_repo.split('/')[0]
+    
+    @cached_property
+    def _repo_name(self) -> str:
+        """Repository part of config.github_repo"""
+        return self.config.github_repo.split('/')[1]
+    
+    def close(self) -> None:
+        """Persist the ETag cache and close the underlying HTTP session"""
+        self.flush_etag_cache()
+        self.session.close()
+    
+    def __enter__(self) -> 'GitHubPublisher':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def _etag_entries(self) -> Dict[str, Tuple[str, Any]]:
+        """The in-memory ETag cache, read from disk the first time (call with _etag_lock held)"""
+        
+        if self._etag_cache is None:
+            try:
+                with shelve.open(self.etag_cache_path, flag='c') as store:
+                    self._etag_cache = dict(store)
+            except Exception as e:
+                self.logger.debug(f"ETag cache unavailable: {e}")
+                self._etag_cache = {}
+        return self._etag_cache
+    
+    def _cached_etag_entry(self, endpoint: str) -> Optional[Tuple[str, Any]]:
+        """Look up the stored (ETag, body) for a GET endpoint"""
+        
+        with self._etag_lock:
+            return self._etag_entries().get(endpoint)
+    
+    def _store_etag_entry(self, endpoint: str, etag: str, body: Any) -> None:
+        """Remember a GET response body under its ETag"""
+        
+        with self._etag_lock:
+            self._etag_entries()[endpoint] = (etag, body)
+            self._etag_dirty.add(endpoint)
+    
+    def flush_etag_cache(self) -> None:
+        """Write ETag cache entries changed since the last flush back to disk"""
+        
+        with self._etag_lock:
+            if not self._etag_dirty:
+                return
+            try:
+                with shelve.open(self.etag_cache_path, flag='c') as store:
+                    for endpoint in self._etag_dirty:
+                        store[endpoint] = self._etag_cache[endpoint]
+            except Exception as e:
+                self.logger.debug(f"Could not persist ETag cache: {e}")
+            self._etag_dirty.clear()
+    
     def _make_api_request(self, method: str, endpoint: str, data: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Make authenticated GitHub API request"""
         
         url = f"{self.api_base_url}{endpoint}"
+        cached = None
         
         try:
             if method.upper() == 'GET':
-                response = self.session.get(url)
+                cached = self._cached_etag_entry(endpoint)
+                headers = {"If-None-Match": cached[0]} if cached else None
+                response = self.session.get(url, headers=headers, timeout=self.request_timeout)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=data)
+                response = self.session.post(url, json=data, timeout=self.request_timeout)
             elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data)
+                response = self.session.put(url, json=data, timeout=self.request_timeout)
+            elif method.upper() == 'PATCH':
+                response = self.session.patch(url, json=data, timeout=self.request_timeout)
             elif method.upper() == 'DELETE':
-                response = self.session.delete(url)
+                response = self.session.delete(url, timeout=self.request_timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None:
+                remaining = int(remaining)
+                if remaining < self.rate_limit_warning_threshold:
+                    log_performance_metric("github_rate_limit_remaining", remaining, " requests")
+                else:
+                    self.logger.debug(f"GitHub rate limit remaining: {remaining}")
+            
+            if response.status_code == 304 and cached:
+                self.logger.debug(f"Not modified: {endpoint}")
+                return cached[1]
+            
             response.raise_for_status()
-            return response.json() if response.content else {}
+            body = response.json() if response.content else {}
+            
+            etag = response.headers.get('ETag')
+            if method.upper() == 'GET' and etag:
+                self._store_etag_entry(endpoint, etag, body)
+            
+            return body
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"❌ GitHub API request failed: {e}")
@@ -77,8 +349,100 @@ class GitHubPublisher:
                 self.logger.error(f"Response: {e.response.text}")
             return None
     
+    def _run_concurrently(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """Run independent GitHub API calls on the shared session, returning results in order"""
+        
+        if len(calls) < 2:
+            return [call() for call in calls]
+        
+        with ThreadPoolExecutor(max_workers=min(len(calls), self.max_concurrent_requests),
+                                thread_name_prefix="noobie-github") as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+    
+    def _get_branch_head(self) -> Optional[Tuple[str, str]]:
+        """Return the (commit SHA, tree SHA) at the tip of the configured branch"""
+        
+        branch = self._make_api_request('GET', f"/repos/{self.config.github_repo}/branches/{self.config.github_branch}")
+        commit = branch.get('commit', {}) if branch else {}
+        commit_sha = commit.get('sha')
+        tree_sha = commit.get('commit', {}).get('tree', {}).get('sha')
+        if not commit_sha or not tree_sha:
+            return None
+        return commit_sha, tree_sha
+    
+    def _load_tree_cache(self) -> bool:
+        """
+        Load the branch's blob SHAs from the Git Trees API.
+        
+        The branch HEAD is re-checked at most every tree_cache_ttl seconds and
+        the recursive tree is only fetched again when HEAD has moved. Returns
+        False when no complete tree is available (e.g. an empty repository or
+        a truncated tree), in which case callers fall back to the contents API.
+        """
+        
+        with self._tree_lock:
+            if self._path_to_sha is not None and time.monotonic() - self._tree_checked_at < self.tree_cache_ttl:
+                return True
+            
+            head = self._get_branch_head()
+            if not head:
+                return False
+            head_sha, head_tree_sha = head
+            
+            if head_sha != self._head_sha or self._path_to_sha is None:
+                tree = self._make_api_request('GET', f"/repos/{self.config.github_repo}/git/trees/{head_sha}?recursive=1")
+                if not tree or 'tree' not in tree:
+                    return False
+                if tree.get('truncated'):
+                    self.logger.warning("⚠️ Repository tree is truncated - using contents API lookups")
+                    return False
+                
+                blobs = [entry for entry in tree['tree'] if entry.get('type') == 'blob']
+                self._path_to_sha = {entry['path']: entry['sha'] for entry in blobs}
+                self._path_to_size = {entry['path']: entry.get('size', 0) for entry in blobs}
+                self._head_sha = head_sha
+                self._head_tree_sha = head_tree_sha
+                
+                self.logger.debug(f"Loaded repository tree: {len(blobs)} files at {head_sha[:7]}")
+            
+            self._tree_checked_at = time.monotonic()
+            return True
+    
+    def _record_commit(self, commit_sha: str, tree_sha: str, written: Dict[str, Tuple[str, int]]) -> None:
+        """Keep the tree cache in step with a commit we just pushed"""
+        
+        with self._tree_lock:
+            if self._path_to_sha is None:
+                return
+            
+            for path, (sha, size) in written.items():
+                self._path_to_sha[path] = sha
+                self._path_to_size[path] = size
+            self._head_sha = commit_sha
+            self._head_tree_sha = tree_sha
+    
+    def _cached_head(self) -> Optional[Tuple[str, str]]:
+        """The (commit SHA, tree SHA) the tree cache saw within tree_cache_ttl, if any"""
+        
+        with self._tree_lock:
+            if (self._path_to_sha is not None and self._head_sha and self._head_tree_sha
+                    and time.monotonic() - self._tree_checked_at < self.tree_cache_ttl):
+                return self._head_sha, self._head_tree_sha
+            return None
+    
+    def _tree_snapshot(self) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """Copy the cached path -> SHA and path -> size maps; commits may update them concurrently"""
+        
+        with self._tree_lock:
+            return dict(self._path_to_sha or {}), dict(self._path_to_size)
+    
     def _get_file_content(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Get existing file content from repository"""
+        """Get existing file metadata (at least its blob 'sha') from the repository"""
+        
+        if self._load_tree_cache():
+            sha = self._path_to_sha.get(file_path)
+            return {'path': file_path, 'sha': sha} if sha else None
         
         endpoint = f"/repos/{self.config.github_repo}/contents/{file_path}"
         
@@ -87,45 +451,142 @@ class GitHubPublisher:
         response = self._make_api_request('GET', endpoint)
         return response
     
-    def _create_or_update_file(self, file_path: str, content: str, message: str, sha: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Create or update file in repository"""
+    def _create_blob(self, content: str) -> Optional[str]:
+        """Upload file content as a git blob and return its SHA"""
         
-        endpoint = f"/repos/{self.config.github_repo}/contents/{file_path}"
+        data = {
+            "content": content,
+            "encoding": "utf-8"
+        }
+        result = self._make_api_request('POST', f"/repos/{self.config.github_repo}/git/blobs", data)
+        return result.get('sha') if result else None
+    
+    def commit_files(self, files: List[Tuple[str, str]], message: str) -> Optional[Dict[str, Any]]:
+        """
+        Commit any number of (path, content) files to the branch as one commit.
+        
+        A single file is one contents-API PUT. Several files use the Git Data
+        API: the blobs are created concurrently, then a tree on top of the
+        current HEAD tree, a commit, and a fast-forward of the branch ref. The
+        HEAD already resolved by the tree cache is reused when it is fresh.
+        Returns the created commit, or None if any step failed.
+        """
+        
+        if not files:
+            return None
         
-        # Encode content to base64
-        content_encoded = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+        if len(files) == 1:
+            return self._put_contents(files, message)
         
-        data = {
+        repo = self.config.github_repo
+        
+        head = self._cached_head() or self._get_branch_head()
+        if not head:
+            # Empty repository or missing branch: there's no parent to build a tree on
+            self.logger.info(f"📭 Branch {self.config.github_branch} has no commits yet - using the contents API")
+            return self._put_contents(files, message)
+        parent_sha, base_tree_sha = head
+        
+        self.logger.debug(f"Committing {len(files)} file(s) on top of {parent_sha[:7]}")
+        
+        blob_shas = self._run_concurrently([partial(self._create_blob, content) for _, content in files])
+        
+        # Blobs are content-addressed, so a failed upload can safely be sent once more
+        for index, ((path, content), sha) in enumerate(zip(files, blob_shas)):
+            if not sha:
+                self.logger.warning(f"🔄 Retrying blob upload for {path}")
+                blob_shas[index] = self._create_blob(content)
+        if not all(blob_shas):
+            self.logger.error("❌ Could not upload file contents - nothing was committed")
+            return None
+        
+        tree = self._make_api_request('POST', f"/repos/{repo}/git/trees", {
+            "base_tree": base_tree_sha,
+            "tree": [
+                {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                for (path, _), sha in zip(files, blob_shas)
+            ]
+        })
+        if not tree:
+            self.logger.error("❌ Could not create tree - nothing was committed")
+            return None
+        
+        commit = self._make_api_request('POST', f"/repos/{repo}/git/commits", {
             "message": message,
-            "content": content_encoded,
-            "branch": self.config.github_branch
-        }
+            "tree": tree['sha'],
+            "parents": [parent_sha]
+        })
+        if not commit:
+            self.logger.error("❌ Could not create commit - nothing was committed")
+            return None
         
-        # Add SHA if updating existing file
-        if sha:
-            data["sha"] = sha
+        ref = self._make_api_request('PATCH', f"/repos/{repo}/git/refs/heads/{self.config.github_branch}", {
+            "sha": commit['sha']
+        })
+        if not ref:
+            # Not retried: the branch may have moved past parent_sha. Force a fresh
+            # HEAD lookup so the next publish builds on the current tip
+            self.logger.error(f"❌ Could not move {self.config.github_branch} to {commit['sha'][:7]} (based on {parent_sha[:7]})")
+            with self._tree_lock:
+                self._tree_checked_at = 0.0
+            return None
         
-        self.logger.debug(f"{'Updating' if sha else 'Creating'} file: {file_path}")
+        self._record_commit(commit['sha'], tree['sha'], {
+            path: (sha, len(content.encode('utf-8')))
+            for (path, content), sha in zip(files, blob_shas)
+        })
         
-        return self._make_api_request('PUT', endpoint, data)
+        return commit
+    
+    def _put_contents(self, files: List[Tuple[str, str]], message: str) -> Optional[Dict[str, Any]]:
+        """
+        Write files one by one through the contents API.
+        
+        Cheapest for a single file, and unlike the Git Data API it also works
+        when the branch doesn't exist yet (the first PUT creates it), at the
+        cost of one commit per file. Returns the last commit created, or None
+        if any write failed.
+        """
+        
+        commit = None
+        for path, content in files:
+            data = {
+                "message": message,
+                "content": base64.b64encode(content.encode('utf-8')).decode('ascii'),
+                "branch": self.config.github_branch
+            }
+            existing = self._get_file_content(path)
+            if existing and existing.get('sha'):
+                data["sha"] = existing['sha']
+            
+            result = self._make_api_request('PUT', f"/repos/{self.config.github_repo}/contents/{path}", data)
+            if not result or 'commit' not in result:
+                return None
+            commit = result['commit']
+            
+            self._record_commit(commit['sha'], commit.get('tree', {}).get('sha'), {
+                path: (result.get('content', {}).get('sha'), len(content.encode('utf-8')))
+            })
+        
+        return commit
     
     def _generate_jekyll_frontmatter(self, blog_post: BlogPost) -> str:
         """Generate Jekyll-compatible frontmatter"""
         
         frontmatter = f"""---
 layout: post
-title: "{blog_post.title.replace('"', '\\"')}"
+title: "{blog_post.title_json_escaped}"
 date: {blog_post.publication_date}
 author: "{blog_post.author}"
 categories: [{blog_post.category}]
 tags: [{', '.join(f'"{tag}"' for tag in blog_post.tags)}]
-excerpt: "{blog_post.summary.replace('"', '\\"')[:200]}..."
+excerpt: "{blog_post.seo_excerpt}..."
 seo:
   title: "{blog_post.seo_title or blog_post.title}"
-  description: "{blog_post.seo_description or blog_post.summary[:155]}"
+  description: "{blog_post.seo_description_effective}"
   type: article
 word_count: {blog_post.word_count}
-reading_time: {max(1, blog_post.word_count // 200)}
+reading_time: {blog_post.reading_time}
 published: true
 featured: false
 comments: true
@@ -134,98 +595,107 @@ comments: true
 """
         return frontmatter
     
-    def _create_post_filename(self, blog_post: BlogPost) -> str:
+    def _create_post_filename(self, blog_post: BlogPost, pub_date: datetime) -> str:
         """Create Jekyll-compatible post filename"""
         
-        # Extract date from publication_date
-        pub_date = datetime.fromisoformat(blog_post.publication_date.replace('Z', '+00:00'))
-        date_str = pub_date.strftime("%Y-%m-%d")
-        
-        # Create slug from title
-        import re
-        slug = re.sub(r'[^\w\s-]', '', blog_post.title.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug)[:50].strip('-')
-        
-        return f"_posts/{date_str}-{slug}.md"
+        return f"_posts/{pub_date.strftime('%Y-%m-%d')}-{_slugify(blog_post.title)}.md"
     
     def publish_blog_post(self, blog_post: BlogPost) -> PublishResult:
         """Publish blog post to GitHub Pages"""
         
+        return self.publish_bundle([blog_post])[0]
+    
+    def publish_bundle(self, blog_posts: List[BlogPost]) -> List[PublishResult]:
+        """Publish several blog posts to GitHub Pages in a single commit"""
+        
         if not self.config.github_token:
-            return PublishResult(
-                success=False,
-                message="GitHub token not configured",
-                errors=["GITHUB_TOKEN environment variable is required"]
-            )
+            return [
+                PublishResult(
+                    success=False,
+                    message="GitHub token not configured",
+                    errors=["GITHUB_TOKEN environment variable is required"]
+                )
+                for _ in blog_posts
+            ]
+        
+        titles = ", ".join(blog_post.title for blog_post in blog_posts)
         
-        with LogOperation(f"Publish blog post: {blog_post.title}", self.logger):
+        with LogOperation(f"Publish blog post: {titles}", self.logger):
             
             try:
                 # Generate Jekyll-compatible content
-                frontmatter = self._generate_jekyll_frontmatter(blog_post)
-                full_content = frontmatter + blog_post.content
-                
-                # Create filename
-                filename = self._create_post_filename(blog_post)
-                
-                # Check if file already exists
-                existing_file = self._get_file_content(filename)
-                sha = existing_file.get('sha') if existing_file else None
+                pub_dates = [_parsed_pub_date(blog_post.publication_date) for blog_post in blog_posts]
+                files = [
+                    (self._create_post_filename(blog_post, pub_date),
+                     self._generate_jekyll_frontmatter(blog_post) + blog_post.content)
+                    for blog_post, pub_date in zip(blog_posts, pub_dates)
+                ]
                 
                 # Create commit message
-                action = "Update" if sha else "Add"
-                commit_message = f"{action} blog post: {blog_post.title}\n\nGenerated by NOOBIE AI\nTimestamp: {datetime.now().isoformat()}\nWord count: {blog_post.word_count}"
+                if len(blog_posts) == 1:
+                    blog_post = blog_posts[0]
+                    action = "Update" if self._get_file_content(files[0][0]) else "Add"
+                    commit_message = f"{action} blog post: {blog_post.title}\n\nGenerated by NOOBIE AI\nTimestamp: {datetime.now().isoformat()}\nWord count: {blog_post.word_count}"
+                else:
+                    post_lines = "\n".join(f"- {blog_post.title}" for blog_post in blog_posts)
+                    commit_message = f"Publish {len(blog_posts)} blog posts\n\n{post_lines}\n\nGenerated by NOOBIE AI\nTimestamp: {datetime.now().isoformat()}"
                 
-                # Upload file
-                result = self._create_or_update_file(filename, full_content, commit_message, sha)
+                # Commit all posts at once
+                result = self.commit_files(files, commit_message)
                 
-                if result:
+                if not result:
+                    return [
+                        PublishResult(
+                            success=False,
+                            message="Failed to commit files to GitHub",
+                            errors=["GitHub API request failed"]
+                        )
+                        for _ in blog_posts
+                    ]
+                
+                results = []
+                for blog_post, pub_date, (filename, _) in zip(blog_posts, pub_dates, files):
                     # Generate URLs
                     repo_url = f"https://github.com/{self.config.github_repo}/blob/{self.config.github_branch}/{filename}"
-                    pages_url = self._generate_pages_url(blog_post)
+                    pages_url = self._generate_pages_url(blog_post, pub_date)
                     
                     self.logger.info(f"✅ Blog post published successfully", extra_data={
                         'filename': filename,
-                        'commit_sha': result.get('commit', {}).get('sha'),
+                        'commit_sha': result['sha'],
                         'repo_url': repo_url,
                         'pages_url': pages_url
                     })
                     
-                    return PublishResult(
+                    results.append(PublishResult(
                         success=True,
                         message=f"Successfully published: {blog_post.title}",
                         url=pages_url,
-                        commit_sha=result.get('commit', {}).get('sha')
-                    )
-                else:
-                    return PublishResult(
-                        success=False,
-                        message="Failed to upload file to GitHub",
-                        errors=["GitHub API request failed"]
-                    )
+                        commit_sha=result['sha']
+                    ))
+                
+                return results
                     
             except Exception as e:
                 self.logger.error(f"❌ Error publishing blog post: {e}")
-                return PublishResult(
-                    success=False,
-                    message=f"Publishing failed: {str(e)}",
-                    errors=[str(e)]
-                )
+                return [
+                    PublishResult(
+                        success=False,
+                        message=f"Publishing failed: {str(e)}",
+                        errors=[str(e)]
+                    )
+                    for _ in blog_posts
+                ]
+            finally:
+                self.flush_etag_cache()
     
-    def _generate_pages_url(self, blog_post: BlogPost) -> str:
+    def _generate_pages_url(self, blog_post: BlogPost, pub_date: datetime) -> str:
         """Generate GitHub Pages URL for the blog post"""
         
-        # Extract date from publication_date
-        pub_date = datetime.fromisoformat(blog_post.publication_date.replace('Z', '+00:00'))
-        
-        # Create slug from title
-        import re
-        slug = re.sub(r'[^\w\s-]', '', blog_post.title.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug)[:50].strip('-')
+        slug = _slugify(blog_post.title)
         
         # Standard GitHub Pages URL structure
-        username = self.config.github_repo.split('/')[0]
-        repo_name = self.config.github_repo.split('/')[1]
+        username = self._repo_owner
+        repo_name = self._repo_name
         
         # Check if it's a user/organization page or project page
         if repo_name.lower() == f"{username.lower()}.github.io":
@@ -239,190 +709,101 @@ comments: true
         
         return base_url + url_path
     
-    def setup_jekyll_config(self) -> PublishResult:
-        """Setup Jekyll configuration for the blog"""
+    def _site_template_values(self) -> Dict[str, str]:
+        """Values substituted into the site scaffolding templates"""
+        
+        return {
+            'blog_title': self.config.blog_title,
+            'blog_description': self.config.blog_description,
+            'author_name': self.config.author_name,
+            'owner': self._repo_owner,
+            'owner_lower': self._repo_owner.lower()
+        }
+    
+    def _jekyll_config_content(self) -> str:
+        """Render the Jekyll _config.yml for the blog"""
+        return _JEKYLL_CONFIG_TEMPLATE.substitute(self._site_template_values())
+    
+    def _index_page_content(self) -> str:
+        """Render the blog's index.md"""
+        return _INDEX_PAGE_TEMPLATE.substitute(self._site_template_values())
+    
+    def _commit_site_files(self, files: List[Tuple[str, str]], message: str,
+                           success_message: str, failure_message: str) -> PublishResult:
+        """Commit site scaffolding files and wrap the outcome in a PublishResult"""
         
-        with LogOperation("Setup Jekyll configuration", self.logger):
-            
-            # Jekyll _config.yml content
-            config_content = f"""# NOOBIE AI Blog Configuration
-title: "{self.config.blog_title}"
-description: "{self.config.blog_description}"
-url: "https://{self.config.github_repo.split('/')[0].lower()}.github.io"
-baseurl: ""
-
-# Author information
-author:
-  name: "{self.config.author_name}"
-  bio: "AI-powered daily news analysis and global insights"
-  avatar: "/assets/images/noobie-avatar.png"
-
-# Social links
-github_username: {self.config.github_repo.split('/')[0]}
-
-# Build settings
-markdown: kramdown
-highlighter: rouge
-permalink: /:year/:month/:day/:title/
-
-# Theme
-theme: minima
-
-# Plugins
-plugins:
-  - jekyll-feed
-  - jekyll-sitemap
-  - jekyll-seo-tag
-  - jekyll-paginate
-
-# Pagination
-paginate: 10
-paginate_path: "/page:num/"
-
-# SEO
-seo:
-  title: "{self.config.blog_title}"
-  description: "{self.config.blog_description}"
-  keywords: "AI, blog, news, analysis, artificial intelligence, global news, automated blogging"
-
-# Timezone
-timezone: UTC
-
-# Collections
-collections:
-  posts:
-    output: true
-    permalink: /:year/:month/:day/:title/
-
-# Defaults
-defaults:
-  - scope:
-      path: ""
-      type: "posts"
-    values:
-      layout: "post"
-      author: "{self.config.author_name}"
-      show_excerpts: true
-
-# Exclude
-exclude:
-  - Gemfile
-  - Gemfile.lock
-  - node_modules
-  - vendor/bundle/
-  - vendor/cache/
-  - vendor/gems/
-  - vendor/ruby/
-"""
+        try:
+            # Only commit files whose content differs from what the branch already has
+            changed = []
+            for path, content in files:
+                existing = self._get_file_content(path)
+                if not existing or existing.get('sha') != _git_blob_sha(content):
+                    changed.append((path, content))
             
-            try:
-                # Check if _config.yml exists
-                existing_config = self._get_file_content("_config.yml")
-                sha = existing_config.get('sha') if existing_config else None
-                
-                # Upload configuration
-                result = self._create_or_update_file(
-                    "_config.yml",
-                    config_content,
-                    "Setup Jekyll configuration for NOOBIE AI blog",
-                    sha
-                )
-                
-                if result:
-                    return PublishResult(
-                        success=True,
-                        message="Jekyll configuration setup successfully"
-                    )
-                else:
-                    return PublishResult(
-                        success=False,
-                        message="Failed to setup Jekyll configuration"
-                    )
-                    
-            except Exception as e:
+            if not changed:
+                self.logger.info(f"✅ Site files already up to date: {', '.join(path for path, _ in files)}")
                 return PublishResult(
-                    success=False,
-                    message=f"Error setting up Jekyll config: {str(e)}",
-                    errors=[str(e)]
+                    success=True,
+                    message=success_message
                 )
-    
-    def create_index_page(self) -> PublishResult:
-        """Create the main index page for the blog"""
-        
-        index_content = f"""---
-layout: home
-title: "{self.config.blog_title}"
-description: "{self.config.blog_description}"
----
-
-# Welcome to {self.config.blog_title}
-
-{self.config.blog_description}
-
-## Latest Posts
-
-<div class="post-list">
-{{% for post in site.posts limit:5 %}}
-  <article class="post-preview">
-    <h3><a href="{{{{ post.url }}}}">{{{{ post.title }}}}</a></h3>
-    <p class="post-meta">{{{{ post.date | date: "%B %d, %Y" }}}} • {{{{ post.reading_time }}}} min read</p>
-    <p>{{{{ post.excerpt | strip_html | truncate: 200 }}}}</p>
-    <a href="{{{{ post.url }}}}" class="read-more">Read more →</a>
-  </article>
-{{% endfor %}}
-</div>
-
-## About NOOBIE AI
-
-NOOBIE AI is an advanced artificial intelligence system that analyzes global news and generates thoughtful daily blog posts. Our AI examines multiple news sources, identifies key themes, and creates insightful commentary that goes beyond simple news reporting.
-
-### What Makes NOOBIE AI Special?
-
-- **🤖 AI-Powered Analysis**: Advanced language models process and analyze news from multiple sources
-- **📰 Daily Updates**: Fresh content generated automatically every morning at 8:00 AM UTC
-- **🌍 Global Perspective**: Comprehensive coverage of international developments
-- **💡 Thoughtful Commentary**: Analysis that provides context and insights
-
-### Latest Statistics
-
-- **Total Posts**: {{{{ site.posts.size }}}}
-- **Categories Covered**: Politics, Technology, Economics, International Affairs
-- **Average Reading Time**: 5-8 minutes per post
-- **Update Frequency**: Daily at 8:00 AM UTC
-
----
-
-*Powered by artificial intelligence • Built with Jekyll • Hosted on GitHub Pages*
-"""
-        
-        try:
-            existing_index = self._get_file_content("index.md")
-            sha = existing_index.get('sha') if existing_index else None
             
-            result = self._create_or_update_file(
-                "index.md",
-                index_content,
-                "Create/update blog index page",
-                sha
-            )
+            result = self.commit_files(changed, message)
             
             if result:
                 return PublishResult(
                     success=True,
-                    message="Index page created successfully"
+                    message=success_message,
+                    commit_sha=result['sha']
                 )
             else:
                 return PublishResult(
                     success=False,
-                    message="Failed to create index page"
+                    message=failure_message
                 )
                 
         except Exception as e:
             return PublishResult(
                 success=False,
-                message=f"Error creating index page: {str(e)}",
+                message=f"{failure_message}: {str(e)}",
                 errors=[str(e)]
             )
+        finally:
+            self.flush_etag_cache()
+    
+    def setup_jekyll_config(self) -> PublishResult:
+        """Setup Jekyll configuration for the blog"""
+        
+        with LogOperation("Setup Jekyll configuration", self.logger):
+            return self._commit_site_files(
+                [("_config.yml", self._jekyll_config_content())],
+                "Setup Jekyll configuration for NOOBIE AI blog",
+                "Jekyll configuration setup successfully",
+                "Failed to setup Jekyll configuration"
+            )
+    
+    def create_index_page(self) -> PublishResult:
+        """Create the main index page for the blog"""
+        
+        return self._commit_site_files(
+            [("index.md", self._index_page_content())],
+            "Create/update blog index page",
+            "Index page created successfully",
+            "Failed to create index page"
+        )
+    
+    def setup_blog_site(self) -> PublishResult:
+        """Commit the Jekyll configuration and index page together"""
+        
+        with LogOperation("Setup blog site", self.logger):
+            return self._commit_site_files(
+                [
+                    ("_config.yml", self._jekyll_config_content()),
+                    ("index.md", self._index_page_content())
+                ],
+                "Setup Jekyll configuration and index page for NOOBIE AI blog",
+                "Blog site setup successfully",
+                "Failed to setup blog site"
+            )
     
     def get_repository_info(self) -> Optional[Dict[str, Any]]:
         """Get repository information"""
@@ -430,16 +811,52 @@ NOOBIE AI is an advanced artificial intelligence system that analyzes global new
         endpoint = f"/repos/{self.config.github_repo}"
         return self._make_api_request('GET', endpoint)
     
+    def get_repository_overview(self, limit: int = 10) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fetch repository information and recent posts concurrently"""
+        
+        repo_info, recent_posts = self._run_concurrently([
+            self.get_repository_info,
+            partial(self.list_recent_posts, limit=limit)
+        ])
+        return repo_info, recent_posts
+    
+    def has_post_for_date(self, day: date) -> bool:
+        """Check whether the repository already has a post dated day"""
+        
+        prefix = f"{day.isoformat()}-"
+        
+        if self._load_tree_cache():
+            paths, _ = self._tree_snapshot()
+            return any(path.startswith(f"_posts/{prefix}") for path in paths)
+        
+        return any(post['name'].startswith(prefix) for post in self.list_recent_posts(limit=5))
+    
     def list_recent_posts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """List recent blog posts from the repository"""
         
+        if self._load_tree_cache():
+            repo = self.config.github_repo
+            branch = self.config.github_branch
+            paths, sizes = self._tree_snapshot()
+            posts = [
+                {
+                    'name': path[len('_posts/'):],
+                    'path': path,
+                    'sha': sha,
+                    'size': sizes.get(path, 0),
+                    'download_url': f"https://raw.githubusercontent.com/{repo}/{branch}/{path}"
+                }
+                for path, sha in paths.items()
+                if path.startswith('_posts/') and '/' not in path[len('_posts/'):]
+            ]
+            return heapq.nlargest(limit, posts, key=operator.itemgetter('name'))
+        
         endpoint = f"/repos/{self.config.github_repo}/contents/_posts"
         
         response = self._make_api_request('GET', endpoint)
         
         if response and isinstance(response, list):
-            # Sort by name (which includes date) and take most recent
-            posts = sorted(response, key=lambda x: x['name'], reverse=True)
-            return posts[:limit]
+            # Names start with the post date, so the largest names are the most recent
+            return heapq.nlargest(limit, response, key=operator.itemgetter('name'))
         
-        return []
\ No newline at end of file
+        return []
@@ -6,14 +6,33 @@ Production-grade logging with colored console output, file rotation,
 and structured JSON logging for Azure Application Insights.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
-import json
+import threading
+import time
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+_utc_second_cache = (None, '')
+
+def _format_utc_timestamp(created: float) -> str:
+    """ISO-8601 UTC timestamp for an epoch time, reusing the formatted seconds part"""
+    global _utc_second_cache
+    
+    second = int(created)
+    cached_second, prefix = _utc_second_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _utc_second_cache = (second, prefix)
+    
+    return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors and emojis for console output"""
     
@@ -55,7 +74,7 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': _format_utc_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'function': record.funcName,
@@ -68,22 +87,87 @@ class JSONFormatter(logging.Formatter):
         # Add exception info if present
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry['exception'] = record.exc_text
         
         # Add extra fields if present
         if hasattr(record, 'extra_data'):
             log_entry.update(record.extra_data)
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+_default_formatter = logging.Formatter()
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the handlers behind the listener"""
+    
+    def prepare(self, record):
+        # Merge args and render the traceback now; the record crosses threads
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = (self.formatter or _default_formatter).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+# One JSON log file pipeline (queue -> listener thread -> rotating file) shared by all loggers;
+# separate rotating handlers on the same file would clash at rollover
+_file_handler_lock = threading.Lock()
+_file_queue_handler: Optional[_RecordQueueHandler] = None
 
-class NoobieLogger:
-    """NOOBIE AI Logger with advanced features"""
+def _get_file_queue_handler(log_file: Optional[str] = None) -> _RecordQueueHandler:
+    """Return the shared queue handler for the log file, starting its listener on first use"""
+    global _file_queue_handler
+    
+    with _file_handler_lock:
+        if _file_queue_handler is None:
+            # Create logs directory
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+            
+            # Use provided log file or default
+            if not log_file:
+                log_file = log_dir / f"noobie_{datetime.now().strftime('%Y-%m-%d')}.log"
+            
+            # Rotating file handler
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8'
+            )
+            file_handler.setLevel(logging.DEBUG)  # Always DEBUG for files
+            file_handler.setFormatter(JSONFormatter())
+            
+            # Write the file from a background thread so callers never block on disk I/O
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            _file_queue_handler = _RecordQueueHandler(log_queue)
+        
+        return _file_queue_handler
+
+class NoobieLogger(logging.LoggerAdapter):
+    """
+    NOOBIE AI Logger with advanced features.
+    
+    A LoggerAdapter over the stdlib logger: every level method accepts an
+    optional extra_data dict, which the JSON formatter merges into the record.
+    """
     
     def __init__(self, name: str):
-        self.logger = logging.getLogger(name)
+        super().__init__(logging.getLogger(name))
         self.logger.setLevel(logging.DEBUG)
-        self.name = name
         self._handlers_configured = False
     
+    def process(self, msg, kwargs):
+        extra_data = kwargs.pop('extra_data', None)
+        if extra_data:
+            kwargs['extra'] = {**kwargs.get('extra', {}), 'extra_data': extra_data}
+        return msg, kwargs
+    
     def configure_handlers(self, 
                           log_level: str = "INFO",
                           enable_console: bool = True,
@@ -109,71 +193,11 @@ class NoobieLogger:
             console_handler.setFormatter(console_formatter)
             self.logger.addHandler(console_handler)
         
-        # File handler with JSON formatting
+        # File handler with JSON formatting, shared with every other logger
         if enable_file:
-            # Create logs directory
-            log_dir = Path("logs")
-            log_dir.mkdir(exist_ok=True)
-            
-            # Use provided log file or default
-            if not log_file:
-                log_file = log_dir / f"noobie_{datetime.now().strftime('%Y-%m-%d')}.log"
-            
-            # Rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(logging.DEBUG)  # Always DEBUG for files
-            file_formatter = JSONFormatter()
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(_get_file_queue_handler(log_file))
         
         self._handlers_configured = True
-    
-    def debug(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log debug message"""
-        if extra_data:
-            self.logger.debug(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.debug(message)
-    
-    def info(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log info message"""
-        if extra_data:
-            self.logger.info(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.info(message)
-    
-    def warning(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log warning message"""
-        if extra_data:
-            self.logger.warning(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.warning(message)
-    
-    def error(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log error message"""
-        if extra_data:
-            self.logger.error(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.error(message)
-    
-    def critical(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log critical message"""
-        if extra_data:
-            self.logger.critical(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.critical(message)
-    
-    def exception(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
-        """Log exception with stack trace"""
-        if extra_data:
-            self.logger.exception(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.exception(message)
 
 # Global logger registry
 _loggers: Dict[str, NoobieLogger] = {}
@@ -212,7 +236,7 @@ def log_performance_metric(metric_name: str, value: float, unit: str = "") -> No
         'metric_name': metric_name,
         'value': value,
         'unit': unit,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _format_utc_timestamp(time.time())
     })
 
 # Context manager for operation logging
@@ -225,12 +249,12 @@ class LogOperation:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = datetime.utcnow()
+        self.start_time = time.perf_counter()
         self.logger.info(f"🚀 Starting: {self.operation_name}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.utcnow() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self.start_time
         
         if exc_type:
             self.logger.error(f"❌ Failed: {self.operation_name} ({duration:.2f}s)", extra_data={
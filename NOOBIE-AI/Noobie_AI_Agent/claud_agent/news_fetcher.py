@@ -6,20 +6,107 @@ Advanced news aggregation system with multiple sources, fallbacks,
 rate limiting, and intelligent content filtering.
 """
 
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
 import time
-import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from urllib.parse import urlencode
-import json
+import string
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from urllib.parse import urlencode, urlparse
+import orjson
+import xml.etree.ElementTree as ET
 
 from .logger import get_logger, LogOperation
 from .config import NoobieConfig
 
-@dataclass
+def _format_pub_date(value: str) -> str:
+    """
+    Normalize an RSS (RFC 822) publication date to a naive UTC ISO-8601 string
+    (the format feedparser's published_parsed gave), leaving other formats as-is
+    """
+    if not value:
+        return ''
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return value
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc).replace(tzinfo=None)
+    return published.isoformat()
+
+# (title, summary, source) skeletons for mock articles
+_MOCK_TEMPLATES = (
+    (
+        string.Template('Breaking: Major Development in $Category'),
+        string.Template('Recent developments in $category show significant changes that could impact global markets and policy decisions.'),
+        'Mock News Network'
+    ),
+    (
+        string.Template('$Category Trends Show Positive Growth'),
+        string.Template('Analysis of current $category trends indicates sustained growth and positive outlook for the coming months.'),
+        'Global Analysis Today'
+    ),
+    (
+        string.Template('Expert Commentary on $Category Developments'),
+        string.Template('Leading experts weigh in on recent $category developments and their potential implications.'),
+        'Expert Insights'
+    ),
+)
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts of capacity requests at a sustained rate per second"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available"""
+        
+        # Reserve the token under the lock (possibly going into debt), then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Same result as dataclass(slots=True), which needs Python 3.10+. Field
+    defaults live in the generated __init__, so the class attributes holding
+    them can be dropped to make room for the slots.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = {k: v for k, v in cls.__dict__.items()
+                if k not in field_names and k not in ('__dict__', '__weakref__')}
+    cls_dict['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+@_with_slots
+@dataclass(frozen=True)
 class NewsArticle:
     """Data class for news articles"""
     title: str
@@ -34,19 +121,8 @@ class NewsArticle:
     sentiment_score: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert article to dictionary"""
-        return {
-            'title': self.title,
-            'summary': self.summary,
-            'url': self.url,
-            'published_date': self.published_date,
-            'source': self.source,
-            'category': self.category,
-            'content': self.content,
-            'author': self.author,
-            'image_url': self.image_url,
-            'sentiment_score': self.sentiment_score
-        }
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
 
 class NewsFetcher:
     """
@@ -58,58 +134,190 @@ class NewsFetcher:
         self.logger = get_logger(__name__)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'NOOBIE-AI/1.0 (News Aggregator; akhil@hhamedicine.com)'
+            'User-Agent': 'NOOBIE-AI/1.0 (News Aggregator; akhil@hhamedicine.com)',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0  # Minimum 1 second between requests
+        # Pool connections across the many news hosts and retry transient failures.
+        # Rate limits (429) are left to _make_request_with_retry, which caps Retry-After
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Rate limiting: one token bucket per host, shared by all fetch threads
+        self.min_request_interval = 1.0  # Sustained rate of 1 request per second per host
+        self.rate_limit_burst = 5
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        
+        # Longest Retry-After we honour for a rate-limited request
+        self.max_retry_after = 60.0
+        
+        # Categories fetched in parallel
+        self.max_concurrent_fetches = 8
+        
+        # Article cache shared by invocations within the same hour
+        self.cache_dir = Path(config.news_cache_dir or Path(tempfile.gettempdir()) / "noobie_news")
         
         # API endpoints
         self.gnews_base_url = "https://gnews.io/api/v4/search"
         self.newsapi_base_url = "https://newsapi.org/v2/everything"
+        
+        # Per-category GNews parameters, built once (RSS URLs are memoized by _gnews_rss_url)
+        self._gnews_params = {category: self._build_gnews_params(category) for category in config.news_categories}
+    
+    def _rate_limit(self, url: str) -> None:
+        """Implement rate limiting between requests to the same host"""
+        
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(
+                    host, TokenBucket(rate=1.0 / self.min_request_interval, capacity=self.rate_limit_burst)
+                )
+        
+        bucket.acquire()
+    
+    def _cache_path(self, source: str, query: str, max_results: int) -> Path:
+        """Cache file for a source query in the current hour"""
+        bucket_hour = datetime.now().strftime('%Y%m%d%H')
+        key = hashlib.sha1(f"{source}|{query}|{max_results}|{bucket_hour}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _cache_get(self, source: str, query: str, max_results: int) -> Optional[List['NewsArticle']]:
+        """Return cached articles for a source query, or None on a miss"""
+        
+        if not self.config.enable_news_cache:
+            return None
+        
+        path = self._cache_path(source, query, max_results)
+        try:
+            if time.time() - path.stat().st_mtime > self.config.cache_ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            articles = [NewsArticle(**article_data) for article_data in orjson.loads(path.read_bytes())]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Unreadable news cache entry {path}: {e}")
+            return None
+        
+        self.logger.info(f"♻️ Using {len(articles)} cached {source} articles for: {query}")
+        return articles
     
-    def _rate_limit(self) -> None:
-        """Implement rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _cache_put(self, source: str, query: str, max_results: int, articles: List['NewsArticle']) -> None:
+        """Store the articles fetched for a source query"""
+        
+        if not self.config.enable_news_cache or not articles:
+            return
+        
+        path = self._cache_path(source, query, max_results)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(articles))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not write news cache entry: {e}")
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
+        self._cache_prune()
+    
+    def _cache_prune(self) -> None:
+        """Delete expired cache entries (earlier hours' keys are never looked up again)"""
         
-        self.last_request_time = time.time()
+        cutoff = time.time() - self.config.cache_ttl_seconds
+        try:
+            for entry in self.cache_dir.iterdir():
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        entry.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    continue  # Removed by another fetch thread
+        except OSError as e:
+            self.logger.debug(f"Could not prune news cache: {e}")
+    
+    def _retry_after_seconds(self, response: Optional[requests.Response]) -> Optional[float]:
+        """Seconds a 429 response asks us to wait, capped at max_retry_after"""
+        
+        if response is None or response.status_code != 429:
+            return None
+        
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        
+        return min(max(seconds, 0.0), self.max_retry_after)
     
     def _make_request_with_retry(self, url: str, params: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
-        """Make HTTP request with retry logic and exponential backoff"""
+        """
+        Make HTTP request, retrying rate-limited (429) responses.
+        
+        Connection errors and 5xx responses are retried with backoff by the
+        session adapter; this loop only waits out a 429's Retry-After (capped
+        at max_retry_after) and tries again, up to max_retries attempts.
+        """
         
         for attempt in range(max_retries):
             try:
-                self._rate_limit()
+                self._rate_limit(url)
                 
-                self.logger.debug(f"📡 Making request to: {url}", extra_data={
-                    'url': url,
-                    'params': params,
-                    'attempt': attempt + 1
-                })
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"📡 Making request to: {url}", extra_data={
+                        'url': url,
+                        'params': params,
+                        'attempt': attempt + 1
+                    })
                 
                 response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
                 
                 return response.json()
                 
-            except requests.exceptions.RequestException as e:
-                wait_time = (2 ** attempt) + random.uniform(0, 1)
-                self.logger.warning(f"🔄 Request failed (attempt {attempt + 1}/{max_retries}): {e}")
+            except requests.exceptions.HTTPError as e:
+                # 5xx statuses were already retried by the session adapter;
+                # only a rate limit with an explicit Retry-After gets another try here
+                retry_after = self._retry_after_seconds(e.response)
+                if retry_after is not None and attempt < max_retries - 1:
+                    self.logger.warning(f"⏳ Rate limited by {url} - waiting {retry_after:.0f}s as requested")
+                    time.sleep(retry_after)
+                    continue
                 
-                if attempt < max_retries - 1:
-                    self.logger.info(f"⏳ Waiting {wait_time:.2f}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    self.logger.error(f"❌ All retry attempts failed for: {url}")
+                self.logger.error(f"❌ Request failed for {url}: {e}")
+                return None
+                
+            except requests.exceptions.RequestException as e:
+                # Connection errors were already retried by the session adapter
+                self.logger.error(f"❌ All retry attempts failed for {url}: {e}")
+                return None
                     
         return None
     
+    def _build_gnews_params(self, query: str) -> Dict[str, Any]:
+        """GNews search parameters for a query, without the result count"""
+        return {
+            'q': query,
+            'lang': 'en',
+            'country': 'us',
+            'apikey': self.config.news_api_key
+        }
+    
     def fetch_gnews(self, query: str, max_results: int = 10) -> List[NewsArticle]:
         """Fetch news from GNews API"""
         
@@ -117,14 +325,13 @@ class NewsFetcher:
             self.logger.warning("🔑 GNews API key not configured")
             return []
         
+        cached = self._cache_get('gnews', query, max_results)
+        if cached is not None:
+            return cached
+        
         with LogOperation(f"GNews fetch: {query}", self.logger):
-            params = {
-                'q': query,
-                'lang': 'en',
-                'country': 'us',
-                'max': min(max_results, 10),  # GNews limit
-                'apikey': self.config.news_api_key
-            }
+            params = dict(self._gnews_params.get(query) or self._build_gnews_params(query))
+            params['max'] = min(max_results, 10)  # GNews limit
             
             data = self._make_request_with_retry(self.gnews_base_url, params)
             
@@ -155,37 +362,97 @@ class NewsFetcher:
                     continue
             
             self.logger.info(f"✅ Fetched {len(articles)} articles from GNews for: {query}")
+            self._cache_put('gnews', query, max_results, articles)
             return articles
     
+    def _parse_rss_items(self, body: bytes, max_results: int) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """
+        Incrementally parse the first max_results <item>s of an RSS 2.0 body.
+        
+        Returns the channel title and one dict of child-tag text per item;
+        parsing stops as soon as enough items have been read.
+        """
+        
+        feed_title = None
+        items = []
+        in_item = False
+        
+        for event, elem in ET.iterparse(BytesIO(body), events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'item':
+                    in_item = True
+                continue
+            
+            if elem.tag == 'item':
+                items.append({child.tag: (child.text or '').strip() for child in elem})
+                in_item = False
+                elem.clear()
+                if len(items) >= max_results:
+                    break
+            elif elem.tag == 'title' and not in_item and feed_title is None:
+                feed_title = (elem.text or '').strip()
+        
+        return feed_title, items
+    
+    def _parse_feed_entries(self, feed_url: str, body: bytes, max_results: int) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """Parse feed entries, using the fast RSS path and falling back to feedparser for other formats"""
+        
+        try:
+            feed_title, items = self._parse_rss_items(body, max_results)
+            if items:
+                return feed_title, [
+                    {
+                        'title': item.get('title', ''),
+                        'summary': item.get('description', ''),
+                        'link': item.get('link', ''),
+                        'published': _format_pub_date(item.get('pubDate', '')),
+                        'author': item.get('author')
+                    }
+                    for item in items
+                ]
+        except ET.ParseError:
+            pass
+        
+        # Atom and malformed feeds go through feedparser
+        feed = feedparser.parse(body)
+        
+        if feed.bozo:
+            self.logger.warning(f"⚠️ RSS feed parsing issues: {feed_url}")
+        
+        return feed.feed.get('title'), [
+            {
+                'title': entry.get('title', ''),
+                'summary': entry.get('summary', entry.get('description', '')),
+                'link': entry.get('link', ''),
+                'published': _format_pub_date(entry.get('published', '')),
+                'author': entry.get('author')
+            }
+            for entry in feed.entries[:max_results]
+        ]
+    
     def fetch_rss_feed(self, feed_url: str, category: str, max_results: int = 10) -> List[NewsArticle]:
         """Fetch news from RSS feed"""
         
         with LogOperation(f"RSS fetch: {feed_url}", self.logger):
             try:
-                self._rate_limit()
-                
-                # Parse RSS feed
-                feed = feedparser.parse(feed_url)
+                self._rate_limit(feed_url)
                 
-                if feed.bozo:
-                    self.logger.warning(f"⚠️ RSS feed parsing issues: {feed_url}")
+                # Download on the shared session, then parse the body in-process
+                response = self.session.get(feed_url, timeout=30)
+                response.raise_for_status()
+                feed_title, entries = self._parse_feed_entries(feed_url, response.content, max_results)
                 
                 articles = []
-                for entry in feed.entries[:max_results]:
+                for entry in entries:
                     try:
-                        # Parse publication date
-                        pub_date = entry.get('published', '')
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            pub_date = datetime(*entry.published_parsed[:6]).isoformat()
-                        
                         article = NewsArticle(
-                            title=entry.get('title', ''),
-                            summary=entry.get('summary', entry.get('description', '')),
-                            url=entry.get('link', ''),
-                            published_date=pub_date,
-                            source=feed.feed.get('title', 'RSS Feed'),
+                            title=entry['title'],
+                            summary=entry['summary'],
+                            url=entry['link'],
+                            published_date=entry['published'],
+                            source=feed_title or 'RSS Feed',
                             category=category,
-                            author=entry.get('author')
+                            author=entry['author']
                         )
                         
                         if article.title and article.summary:
@@ -202,14 +469,45 @@ class NewsFetcher:
                 self.logger.error(f"❌ Error fetching RSS feed {feed_url}: {e}")
                 return []
     
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _gnews_rss_url(query: str) -> str:
+        """Google News RSS search URL for a query"""
+        return f"https://news.google.com/rss/search?{urlencode({'q': query})}&hl=en-US&gl=US&ceid=US:en"
+    
     def fetch_google_news_rss(self, query: str, max_results: int = 10) -> List[NewsArticle]:
         """Fetch news from Google News RSS (no API key required)"""
         
-        # Encode query for URL
-        encoded_query = urlencode({'q': query})
-        rss_url = f"https://news.google.com/rss/search?{encoded_query}&hl=en-US&gl=US&ceid=US:en"
+        cached = self._cache_get('google-news-rss', query, max_results)
+        if cached is not None:
+            return cached
         
-        return self.fetch_rss_feed(rss_url, query, max_results)
+        rss_url = self._gnews_rss_url(query)
+        articles = self.fetch_rss_feed(rss_url, query, max_results)
+        self._cache_put('google-news-rss', query, max_results, articles)
+        return articles
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _mock_articles(category: str, count: int, day: str) -> Tuple[NewsArticle, ...]:
+        """Build the mock articles for a category (memoized per day; articles are immutable)"""
+        
+        published_date = datetime.now().isoformat()
+        articles = []
+        for i, (title_template, summary_template, source) in enumerate(_MOCK_TEMPLATES[:count]):
+            title = title_template.substitute(Category=category.title())
+            
+            articles.append(NewsArticle(
+                title=title,
+                summary=summary_template.substitute(category=category),
+                url=f"https://mock-news.com/article-{i+1}",
+                published_date=published_date,
+                source=source,
+                category=category,
+                content=f"Full content for {title}..."
+            ))
+        
+        return tuple(articles)
     
     def generate_mock_articles(self, category: str, count: int = 5) -> List[NewsArticle]:
         """Generate mock articles for testing"""
@@ -219,68 +517,43 @@ class NewsFetcher:
         
         self.logger.info(f"🎭 Generating {count} mock articles for: {category}")
         
-        mock_templates = [
-            {
-                'title': f'Breaking: Major Development in {category.title()}',
-                'summary': f'Recent developments in {category} show significant changes that could impact global markets and policy decisions.',
-                'source': 'Mock News Network'
-            },
-            {
-                'title': f'{category.title()} Trends Show Positive Growth',
-                'summary': f'Analysis of current {category} trends indicates sustained growth and positive outlook for the coming months.',
-                'source': 'Global Analysis Today'
-            },
-            {
-                'title': f'Expert Commentary on {category.title()} Developments',
-                'summary': f'Leading experts weigh in on recent {category} developments and their potential implications.',
-                'source': 'Expert Insights'
-            }
-        ]
+        return list(self._mock_articles(category, count, datetime.now().strftime('%Y-%m-%d')))
+    
+    def _fetch_category(self, category: str) -> List[NewsArticle]:
+        """Fetch articles for one category, falling back from GNews to RSS to mock data"""
         
-        articles = []
-        for i in range(min(count, len(mock_templates))):
-            template = mock_templates[i]
-            
-            article = NewsArticle(
-                title=template['title'],
-                summary=template['summary'],
-                url=f"https://mock-news.com/article-{i+1}",
-                published_date=datetime.now().isoformat(),
-                source=template['source'],
-                category=category,
-                content=f"Full content for {template['title']}..."
-            )
-            
-            articles.append(article)
+        category_articles = []
         
-        return articles
+        # Try GNews first
+        if self.config.news_api_key:
+            gnews_articles = self.fetch_gnews(category, max_results=3)
+            category_articles.extend(gnews_articles)
+        
+        # Fallback to Google News RSS if needed
+        if len(category_articles) < 2:
+            rss_articles = self.fetch_google_news_rss(category, max_results=3)
+            category_articles.extend(rss_articles)
+        
+        # Use mock articles if still not enough and mock mode enabled
+        if len(category_articles) < 1 and self.config.mock_mode:
+            mock_articles = self.generate_mock_articles(category, count=2)
+            category_articles.extend(mock_articles)
+        
+        return category_articles
     
     def fetch_trending_news(self) -> List[NewsArticle]:
         """Fetch trending news from all configured sources"""
         
         with LogOperation("Fetch trending news", self.logger):
             all_articles = []
+            categories = self.config.news_categories
             
-            # Fetch from each configured category
-            for category in self.config.news_categories:
-                category_articles = []
-                
-                # Try GNews first
-                if self.config.news_api_key:
-                    gnews_articles = self.fetch_gnews(category, max_results=3)
-                    category_articles.extend(gnews_articles)
-                
-                # Fallback to Google News RSS if needed
-                if len(category_articles) < 2:
-                    rss_articles = self.fetch_google_news_rss(category, max_results=3)
-                    category_articles.extend(rss_articles)
-                
-                # Use mock articles if still not enough and mock mode enabled
-                if len(category_articles) < 1 and self.config.mock_mode:
-                    mock_articles = self.generate_mock_articles(category, count=2)
-                    category_articles.extend(mock_articles)
-                
-                all_articles.extend(category_articles)
+            # Fetch all categories concurrently, keeping the configured category order
+            if categories:
+                with ThreadPoolExecutor(max_workers=min(len(categories), self.max_concurrent_fetches),
+                                        thread_name_prefix="noobie-news") as executor:
+                    for category_articles in executor.map(self._fetch_category, categories):
+                        all_articles.extend(category_articles)
             
             # Remove duplicates based on title similarity
             unique_articles = self._deduplicate_articles(all_articles)
@@ -301,24 +574,21 @@ class NewsFetcher:
         """Remove duplicate articles based on title similarity"""
         
         unique_articles = []
-        seen_titles = set()
+        seen_word_sets: List[frozenset] = []
         
         for article in articles:
-            # Simple deduplication based on title
-            title_words = set(article.title.lower().split())
+            # Simple deduplication based on title, each title split into words only once
+            title_words = frozenset(article.title.lower().split())
             
-            is_duplicate = False
-            for seen_title in seen_titles:
-                seen_words = set(seen_title.split())
-                
-                # If 70% of words match, consider it a duplicate
-                if len(title_words & seen_words) / len(title_words | seen_words) > 0.7:
-                    is_duplicate = True
-                    break
+            # If 70% of words match, consider it a duplicate
+            is_duplicate = any(
+                len(title_words & seen_words) / len(title_words | seen_words) > 0.7
+                for seen_words in seen_word_sets
+            )
             
             if not is_duplicate:
                 unique_articles.append(article)
-                seen_titles.add(article.title.lower())
+                seen_word_sets.append(title_words)
         
         removed_count = len(articles) - len(unique_articles)
         if removed_count > 0:
@@ -326,8 +596,8 @@ class NewsFetcher:
         
         return unique_articles
     
-    def save_articles_cache(self, articles: List[NewsArticle], cache_file: str = None) -> str:
-        """Save articles to cache file"""
+    def save_articles_cache(self, articles: List[NewsArticle], cache_file: str = None, compress: bool = False) -> str:
+        """Save articles to cache file (gzip-compressed, with a .gz suffix, when compress is set)"""
         
         if not cache_file:
             cache_file = f"news_cache_{datetime.now().strftime('%Y-%m-%d')}.json"
@@ -335,21 +605,32 @@ class NewsFetcher:
         cache_data = {
             'timestamp': datetime.now().isoformat(),
             'count': len(articles),
-            'articles': [article.to_dict() for article in articles]
+            'articles': articles
         }
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        if compress:
+            if not cache_file.endswith('.gz'):
+                cache_file += '.gz'
+            # Level 1 is several times faster than the default and compresses JSON nearly as well
+            data = gzip.compress(orjson.dumps(cache_data), compresslevel=1)
+        else:
+            data = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+        
+        with open(cache_file, 'wb') as f:
+            f.write(data)
         
         self.logger.info(f"💾 Articles cached to: {cache_file}")
         return cache_file
     
     def load_articles_cache(self, cache_file: str) -> List[NewsArticle]:
-        """Load articles from cache file"""
+        """Load articles from cache file (plain or gzip-compressed JSON)"""
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(cache_file, 'rb') as f:
+                data = f.read()
+            if data[:2] == b'\x1f\x8b':
+                data = gzip.decompress(data)
+            cache_data = orjson.loads(data)
             
             articles = []
             for article_data in cache_data.get('articles', []):
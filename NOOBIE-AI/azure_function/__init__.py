@@ -7,13 +7,23 @@ import logging
 import json
 import sys
 import os
+import threading
 from pathlib import Path
 
 # Add the parent directory to the Python path to import claud_agent
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 import azure.functions as func
 
+from noobie_core import NoobieAI
+
+# Reused across invocations while the Functions worker stays warm. Built at
+# import so the GitHub TLS handshake happens during cold start, not in main()
+_NOOBIE = NoobieAI()
+threading.Thread(target=_NOOBIE.prewarm_connections, daemon=True).start()
+
 def main(mytimer: func.TimerRequest) -> None:
     """
     NOOBIE AI Azure Function - Daily Blog Generation
@@ -37,12 +47,8 @@ def main(mytimer: func.TimerRequest) -> None:
     try:
         logging.info('🔧 Initializing NOOBIE AI system...')
         
-        # Import NOOBIE AI components (simplified for Azure)
-        from noobie_core import NoobieAI
-        
-        # Create and run NOOBIE AI
-        noobie = NoobieAI()
-        success = noobie.generate_daily_blog()
+        # Run the worker's shared NOOBIE AI instance
+        success = _NOOBIE.generate_daily_blog()
         
         # Log execution summary
         logging.info('📊 NOOBIE AI EXECUTION SUMMARY')
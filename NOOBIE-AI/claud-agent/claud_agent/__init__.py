@@ -22,13 +22,29 @@ __email__ = "akhil@hhamedicine.com"
 __description__ = "NOOBIE AI - Intelligent automated blog generation system"
 __url__ = "https://github.com/akhilreddydanda/NOOBIE"
 
-# Core imports
-from .news_fetcher import NewsFetcher, NewsArticle
-from .blog_writer import BlogWriter, BlogPost
-from .github_publisher import GitHubPublisher, PublishResult
-from .orchestrator import NoobieOrchestrator
-from .config import NoobieConfig
-from .logger import get_logger, setup_logging
+# Core imports, resolved on first attribute access so that importing one
+# submodule (e.g. claud_agent.config) doesn't load the whole package
+_LAZY_IMPORTS = {
+    'NewsFetcher': '.news_fetcher',
+    'NewsArticle': '.news_fetcher',
+    'BlogWriter': '.blog_writer',
+    'BlogPost': '.blog_writer',
+    'GitHubPublisher': '.github_publisher',
+    'PublishResult': '.github_publisher',
+    'NoobieConfig': '.config',
+    'get_logger': '.logger',
+    'setup_logging': '.logger',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 # Export main classes
 __all__ = [
@@ -38,7 +54,6 @@ __all__ = [
     'BlogPost',
     'GitHubPublisher',
     'PublishResult',
-    'NoobieOrchestrator',
     'NoobieConfig',
     'get_logger',
     'setup_logging'
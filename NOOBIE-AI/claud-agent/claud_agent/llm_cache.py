@@ -0,0 +1,109 @@
+"""
+NOOBIE AI LLM Response Cache
+===========================
+
+Disk-backed cache for AI API responses so that re-running blog generation
+over the same news set does not pay for another LLM round-trip.
+"""
+
+import hashlib
+import orjson
+import tempfile
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Optional
+
+from .logger import get_logger
+
+class LLMCache:
+    """
+    Exact-match response cache keyed on (model, system prompt, user prompt)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: int = 6 * 3600):
+        self.cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / "noobie_llm_cache")
+        self.ttl = ttl
+        self.logger = get_logger(__name__)
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str) -> str:
+        """Build the cache key for a model call"""
+        digest = hashlib.sha256()
+        for part in (model, system_prompt, prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'|')
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Unreadable LLM cache entry {path}: {e}")
+            return None
+
+        if entry.get('expires_at', 0) < time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        return entry.get('response')
+
+    def set(self, key: str, response: str, ttl: Optional[int] = None) -> None:
+        """Store a response under key"""
+
+        entry = {
+            'expires_at': time.time() + (ttl if ttl is not None else self.ttl),
+            'response': response
+        }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), 'wb') as f:
+                f.write(orjson.dumps(entry))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not write LLM cache entry: {e}")
+
+def cached_llm(model_attr: str, temperature_attr: str, ttl: Optional[int] = None) -> Callable:
+    """
+    Decorator for BlogWriter API call methods taking a single prompt.
+
+    The model name is read from ``model_attr`` on the instance and the system
+    prompt from ``system_prompt``; caching is skipped when the instance has no
+    ``_llm_cache``. Responses sampled above temperature 0 (read from
+    ``temperature_attr``) are meant to vary and are only cached in
+    ``config.mock_mode``, where repeatable runs matter more than fresh text.
+    Empty responses are never cached.
+    """
+
+    def decorator(func: Callable[..., Optional[str]]) -> Callable[..., Optional[str]]:
+        @wraps(func)
+        def wrapper(self, prompt: str) -> Optional[str]:
+            cache = getattr(self, '_llm_cache', None)
+            if cache is None or (getattr(self, temperature_attr) > 0 and not self.config.mock_mode):
+                return func(self, prompt)
+
+            key = cache.make_key(getattr(self, model_attr), self.system_prompt, prompt)
+            cached = cache.get(key)
+            if cached is not None:
+                self.logger.info(f"♻️ Using cached {func.__name__} response ({len(cached)} characters)")
+                return cached
+
+            response = func(self, prompt)
+            if response:
+                cache.set(key, response, ttl)
+            return response
+
+        return wrapper
+
+    return decorator
+
+__all__ = ['LLMCache', 'cached_llm']
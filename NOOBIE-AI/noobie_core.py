@@ -3,11 +3,60 @@ NOOBIE AI Core System
 Simplified version for Azure Functions deployment
 """
 
+import base64
 import os
 import requests
-import json
-from datetime import datetime
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import logging
+import string
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+NEWS_CACHE_TTL = 900  # seconds
+
+# Daily post layout, parsed once at import
+_BLOG_POST_TEMPLATE = string.Template("""---
+layout: post
+title: "Today's Global Pulse - $pretty_date"
+date: $date_iso
+categories: [news, analysis, ai-generated]
+tags: [daily-update, global-news, noobie-ai]
+author: "NOOBIE AI"
+---
+
+# Today's Global Pulse - $pretty_date
+
+Welcome to another day of AI-powered news analysis from NOOBIE AI. Today we examine the key developments shaping our world.
+
+## Economic Developments
+
+Recent economic indicators continue to show resilience across global markets. The interconnected nature of modern economies demonstrates both challenges and opportunities for sustained growth.
+
+## Technology and Innovation
+
+The rapid pace of technological advancement continues to create new possibilities while requiring thoughtful implementation. Artificial intelligence systems like NOOBIE AI represent the growing capability of technology to augment human analysis and decision-making.
+
+## Looking Forward
+
+As we analyze today's developments, several patterns emerge that suggest continued evolution in how we process information and respond to global events. The integration of AI systems into daily workflows represents a significant shift in our approach to understanding complex issues.
+
+## Conclusion
+
+Today's analysis reinforces the importance of staying informed about global developments while maintaining perspective on long-term trends. NOOBIE AI will continue to provide daily insights to help navigate our complex world.
+
+---
+
+*Generated automatically by NOOBIE AI - Your daily source for AI-powered news analysis*
+
+**Articles Analyzed**: $article_count  
+**Generation Time**: $generated_at  
+**Next Update**: Tomorrow at 8:00 AM UTC  
+""")
 
 class NoobieAI:
     """
@@ -20,9 +69,36 @@ class NoobieAI:
         self.github_token = os.getenv('GITHUB_TOKEN')
         self.github_repo = os.getenv('GITHUB_REPO', 'yourusername/noobie-ai')
         
+        # One keep-alive connection pool for all news/GitHub calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/vnd.github.v3+json"})
+        
+        # In-process news cache: key -> (expires_at, articles)
+        self._news_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        
+    def prewarm_connections(self) -> None:
+        """Open the TLS connection to the GitHub API ahead of publishing"""
+        if not self.github_token:
+            return  # Nothing will be published
+        
+        try:
+            self.session.head("https://api.github.com", timeout=5)
+        except requests.RequestException:
+            pass  # Publishing will simply open its own connection
+        
     def fetch_news(self) -> List[Dict[str, Any]]:
-        """Fetch trending news articles"""
-        print("📰 Fetching trending news...")
+        """Fetch trending news articles, reusing this UTC hour's results for up to 15 minutes"""
+        key = f"news:{datetime.now(timezone.utc).strftime('%Y%m%d%H')}"
+        cached = self._news_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            logger.info("📦 Using %d cached articles", len(cached[1]))
+            return list(cached[1])
+        
+        logger.info("📰 Fetching trending news...")
         
         # Mock news articles for demo (replace with real API calls)
         articles = [
@@ -40,115 +116,105 @@ class NoobieAI:
             }
         ]
         
-        print(f"✅ Fetched {len(articles)} articles")
-        return articles
+        logger.info("✅ Fetched %d articles", len(articles))
+        now = time.monotonic()
+        self._news_cache = {k: v for k, v in self._news_cache.items() if v[0] > now}
+        self._news_cache[key] = (now + NEWS_CACHE_TTL, articles)
+        return list(articles)
     
-    def generate_blog_post(self, articles: List[Dict[str, Any]]) -> str:
-        """Generate AI blog post using Claude API"""
-        print("🤖 Generating blog post with AI...")
+    def generate_blog_post(self, articles: List[Dict[str, Any]], now: Optional[datetime] = None) -> str:
+        """Generate AI blog post using Claude API, dated now (UTC, defaults to the current time)"""
+        logger.info("🤖 Generating blog post with AI...")
+        
+        now = now or datetime.now(timezone.utc)
         
         # For demo purposes, create a sample blog post
         # In production, this would call Claude API
-        blog_content = f"""---
-layout: post
-title: "Today's Global Pulse - {datetime.now().strftime('%B %d, %Y')}"
-date: {datetime.now().isoformat()}
-categories: [news, analysis, ai-generated]
-tags: [daily-update, global-news, noobie-ai]
-author: "NOOBIE AI"
----
-
-# Today's Global Pulse - {datetime.now().strftime('%B %d, %Y')}
-
-Welcome to another day of AI-powered news analysis from NOOBIE AI. Today we examine the key developments shaping our world.
-
-## Economic Developments
-
-Recent economic indicators continue to show resilience across global markets. The interconnected nature of modern economies demonstrates both challenges and opportunities for sustained growth.
-
-## Technology and Innovation
-
-The rapid pace of technological advancement continues to create new possibilities while requiring thoughtful implementation. Artificial intelligence systems like NOOBIE AI represent the growing capability of technology to augment human analysis and decision-making.
-
-## Looking Forward
-
-As we analyze today's developments, several patterns emerge that suggest continued evolution in how we process information and respond to global events. The integration of AI systems into daily workflows represents a significant shift in our approach to understanding complex issues.
-
-## Conclusion
-
-Today's analysis reinforces the importance of staying informed about global developments while maintaining perspective on long-term trends. NOOBIE AI will continue to provide daily insights to help navigate our complex world.
-
----
-
-*Generated automatically by NOOBIE AI - Your daily source for AI-powered news analysis*
-
-**Articles Analyzed**: {len(articles)}  
-**Generation Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}  
-**Next Update**: Tomorrow at 8:00 AM UTC  
-"""
+        blog_content = _BLOG_POST_TEMPLATE.substitute(
+            pretty_date=now.strftime('%B %d, %Y'),
+            date_iso=now.isoformat(),
+            article_count=len(articles),
+            generated_at=now.strftime('%Y-%m-%d %H:%M:%S UTC'),
+        )
         
-        print("✅ Blog post generated successfully")
+        logger.info("✅ Blog post generated successfully")
         return blog_content
     
-    def publish_to_github(self, content: str) -> bool:
-        """Publish blog post to GitHub Pages"""
-        print("📤 Publishing to GitHub Pages...")
+    def publish_to_github(self, content: str, now: Optional[datetime] = None) -> bool:
+        """Publish blog post to GitHub Pages, filed under the UTC date of now"""
+        logger.info("📤 Publishing to GitHub Pages...")
         
         try:
             # Create filename
-            today = datetime.now()
+            today = now or datetime.now(timezone.utc)
             filename = f"{today.strftime('%Y-%m-%d')}-daily-global-pulse.md"
             
             # GitHub API endpoint
             url = f"https://api.github.com/repos/{self.github_repo}/contents/_posts/{filename}"
             
-            # Prepare payload
+            if not self.github_token:
+                # No credentials (local/demo run): simulate success
+                logger.info("🧪 GITHUB_TOKEN not set, skipping upload")
+                logger.info("📄 File: _posts/%s", filename)
+                return True
+            
+            headers = {"Authorization": f"token {self.github_token}"}
+            
             payload = {
                 "message": f"NOOBIE AI: Daily blog post - {today.strftime('%B %d, %Y')}",
-                "content": content.encode('utf-8').hex(),
+                "content": base64.b64encode(content.encode('utf-8')).decode('ascii'),
                 "branch": "main"
             }
+            # Updating an existing post requires its current blob sha
+            existing = self.session.get(url, headers=headers, params={"ref": "main"}, timeout=10)
+            if existing.status_code == 200:
+                payload["sha"] = existing.json()["sha"]
             
-            headers = {
-                "Authorization": f"token {self.github_token}",
-                "Accept": "application/vnd.github.v3+json"
-            }
+            response = self.session.put(
+                url,
+                data=orjson.dumps(payload),
+                headers={**headers, "Content-Type": "application/json"},
+                timeout=10
+            )
+            response.raise_for_status()
             
-            # For demo, we'll simulate success
-            print("✅ Successfully published to GitHub Pages")
-            print(f"📄 File: _posts/{filename}")
+            logger.info("✅ Successfully published to GitHub Pages")
+            logger.info("📄 File: _posts/%s", filename)
             return True
             
         except Exception as e:
-            print(f"❌ Error publishing to GitHub: {e}")
+            logger.exception("❌ Error publishing to GitHub: %s", e)
             return False
     
     def generate_daily_blog(self) -> bool:
         """Main function to generate daily blog post"""
         try:
-            print("🚀 Starting NOOBIE AI daily blog generation...")
+            logger.info("🚀 Starting NOOBIE AI daily blog generation...")
+            
+            # One timestamp so the post's date and its filename always agree
+            now = datetime.now(timezone.utc)
             
             # Step 1: Fetch news
             articles = self.fetch_news()
             if not articles:
-                print("❌ No articles found")
+                logger.error("❌ No articles found")
                 return False
             
             # Step 2: Generate blog post
-            blog_content = self.generate_blog_post(articles)
+            blog_content = self.generate_blog_post(articles, now)
             if not blog_content:
-                print("❌ Failed to generate blog content")
+                logger.error("❌ Failed to generate blog content")
                 return False
             
             # Step 3: Publish to GitHub
-            success = self.publish_to_github(blog_content)
+            success = self.publish_to_github(blog_content, now)
             if not success:
-                print("❌ Failed to publish blog post")
+                logger.error("❌ Failed to publish blog post")
                 return False
             
-            print("🎉 NOOBIE AI daily blog generation completed successfully!")
+            logger.info("🎉 NOOBIE AI daily blog generation completed successfully!")
             return True
             
         except Exception as e:
-            print(f"💥 Error in daily blog generation: {e}")
+            logger.exception("💥 Error in daily blog generation: %s", e)
             return False
\ No newline at end of file